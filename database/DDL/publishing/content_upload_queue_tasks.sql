@@ -28,6 +28,8 @@ CREATE TABLE IF NOT EXISTS `content_upload_queue_tasks` (
   `upload_url`        VARCHAR(500)    DEFAULT NULL COMMENT 'URL to published content',
   `retry_count`       INT             NOT NULL DEFAULT 0,
   `max_retries`       INT             NOT NULL DEFAULT 3,
+  `enqueue_attempts`  INT             NOT NULL DEFAULT 0 COMMENT 'Failed scheduler hand-offs, not manual retries (migration 012)',
+  `next_attempt_at`   DATETIME        DEFAULT NULL COMMENT 'Retry backoff: not picked up before this (migration 011)',
   `error_message`     TEXT            DEFAULT NULL,
   `error_code`        VARCHAR(100)    DEFAULT NULL COMMENT 'Categorized error code',
   `legacy_add_info`   LONGTEXT        DEFAULT NULL COMMENT 'Preserved legacy add_info JSON',
@@ -40,6 +42,8 @@ CREATE TABLE IF NOT EXISTS `content_upload_queue_tasks` (
   KEY `idx_cuqt_created_by`         (`created_by`),
   KEY `idx_cuqt_project_status`     (`project_id`, `status`),
   KEY `idx_cuqt_channel_status`     (`channel_id`, `status`),
+  -- Serves the scheduler's claim: status = 0 AND scheduled_at <= NOW()
+  -- ORDER BY scheduled_at LIMIT n FOR UPDATE SKIP LOCKED
   KEY `idx_cuqt_status_scheduled`   (`status`, `scheduled_at`),
   KEY `idx_cuqt_platform`           (`platform`),
   KEY `idx_cuqt_upload_id`          (`upload_id`),
@@ -0,0 +1,18 @@
+-- Migration 011: Add retry backoff column to content_upload_queue_tasks
+-- Idempotent: safe to run multiple times
+
+SET @dbname = DATABASE();
+
+-- Earliest time a requeued task may be picked up again (NULL = no backoff)
+SET @col_exists = (
+    SELECT COUNT(*) FROM INFORMATION_SCHEMA.COLUMNS
+    WHERE TABLE_SCHEMA = @dbname AND TABLE_NAME = 'content_upload_queue_tasks' AND COLUMN_NAME = 'next_attempt_at'
+);
+SET @sql = IF(@col_exists = 0,
+    'ALTER TABLE content_upload_queue_tasks ADD COLUMN next_attempt_at DATETIME DEFAULT NULL AFTER max_retries',
+    'SELECT "next_attempt_at already exists"');
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+-- Record migration
+INSERT IGNORE INTO platform_schema_migrations (version, description, applied_at, execution_ms)
+VALUES ('011', 'Add next_attempt_at retry backoff to content_upload_queue_tasks', NOW(), 0);
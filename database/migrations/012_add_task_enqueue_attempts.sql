@@ -0,0 +1,19 @@
+-- Migration 012: Add enqueue_attempts counter to content_upload_queue_tasks
+-- Idempotent: safe to run multiple times
+
+SET @dbname = DATABASE();
+
+-- Failed scheduler hand-offs to Redis since the task last became due.
+-- Kept apart from retry_count, which counts manual retries.
+SET @col_exists = (
+    SELECT COUNT(*) FROM INFORMATION_SCHEMA.COLUMNS
+    WHERE TABLE_SCHEMA = @dbname AND TABLE_NAME = 'content_upload_queue_tasks' AND COLUMN_NAME = 'enqueue_attempts'
+);
+SET @sql = IF(@col_exists = 0,
+    'ALTER TABLE content_upload_queue_tasks ADD COLUMN enqueue_attempts INT NOT NULL DEFAULT 0 AFTER max_retries',
+    'SELECT "enqueue_attempts already exists"');
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+-- Record migration
+INSERT IGNORE INTO platform_schema_migrations (version, description, applied_at, execution_ms)
+VALUES ('012', 'Add enqueue_attempts counter to content_upload_queue_tasks', NOW(), 0);
@@ -0,0 +1,6 @@
+-- Rollback 011: Remove retry backoff column from content_upload_queue_tasks
+
+ALTER TABLE content_upload_queue_tasks
+    DROP COLUMN IF EXISTS next_attempt_at;
+
+DELETE FROM platform_schema_migrations WHERE version = '011';
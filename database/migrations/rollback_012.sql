@@ -0,0 +1,6 @@
+-- Rollback 012: Remove enqueue_attempts counter from content_upload_queue_tasks
+
+ALTER TABLE content_upload_queue_tasks
+    DROP COLUMN IF EXISTS enqueue_attempts;
+
+DELETE FROM platform_schema_migrations WHERE version = '012';
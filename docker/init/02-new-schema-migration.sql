@@ -251,6 +251,8 @@ CREATE TABLE IF NOT EXISTS `content_upload_queue_tasks` (
   `upload_url`        VARCHAR(500)    DEFAULT NULL COMMENT 'URL to published content',
   `retry_count`       INT             NOT NULL DEFAULT 0,
   `max_retries`       INT             NOT NULL DEFAULT 3,
+  `enqueue_attempts`  INT             NOT NULL DEFAULT 0 COMMENT 'Failed scheduler hand-offs (not manual retries)',
+  `next_attempt_at`   DATETIME        DEFAULT NULL COMMENT 'Retry backoff: not picked up before this',
   `error_message`     TEXT            DEFAULT NULL,
   `error_code`        VARCHAR(100)    DEFAULT NULL COMMENT 'Categorized error code',
   `legacy_add_info`   LONGTEXT        DEFAULT NULL COMMENT 'Preserved legacy add_info JSON',
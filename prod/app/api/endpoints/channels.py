@@ -24,6 +24,7 @@ from app.schemas.channel import Channel, ChannelCreate, OAuthCredential
 from app.services.youtube_validator import validate_channel_id
 from shared.db.models import UserStatus
 from shared.db.repositories import channel_repo as _channel_repo, task_repo as _task_repo
+from shared.queue.wake import wake_scheduler
 
 logger = logging.getLogger(__name__)
 
@@ -178,5 +179,7 @@ async def retry_all_failed(channel_id: int, user: dict = Depends(get_current_use
     if user["status"] != UserStatus.ADMIN.value and channel.get("created_by") != user["id"]:
         raise HTTPException(status_code=404, detail="Channel not found")
     count = _task_repo.retry_all_failed_by_channel(channel_id)
+    if count:
+        wake_scheduler()
     logger.info("retry-all-failed: channel=%s reset=%s by user=%s", channel_id, count, user["id"])
     return {"channel_id": channel_id, "retried": count}
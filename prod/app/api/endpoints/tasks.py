@@ -14,6 +14,7 @@ from app.core.auth import check_owner_or_404, scoped_user_id
 from app.schemas.task import TaskBatchCreate, TaskCreate, TaskListResponse, TaskResponse, TaskUpdate
 from shared.db.models import TaskStatus, UserStatus
 from shared.db.repositories import channel_repo, task_repo
+from shared.queue.wake import wake_scheduler
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -46,6 +47,7 @@ async def create_task(request: Request, body: TaskCreate, user: dict = Depends(g
         logger.error("Failed to create task: user=%s channel=%s", user["id"], body.channel_id)
         raise HTTPException(status_code=500, detail="Failed to create task")
 
+    wake_scheduler()
     task = task_repo.get_task(task_id)
     logger.info("Task created: id=%s user=%s channel=%s", task_id, user["id"], body.channel_id)
     audit_log("task.create", actor_id=user.get("id"), entity_type="task", entity_id=task_id,
@@ -65,9 +67,10 @@ async def create_tasks_batch(request: Request, body: TaskBatchCreate, user: dict
     for td in task_dicts:
         td["created_by"] = user["id"]
     ids = task_repo.create_tasks_batch(task_dicts)
+    if ids:
+        wake_scheduler()
 
-    tasks = [task_repo.get_task(tid) for tid in ids]
-    tasks = [t for t in tasks if t is not None]
+    tasks = task_repo.get_tasks_by_ids(ids)
 
     audit_log("task.batch_create", actor_id=user.get("id"), entity_type="task",
               metadata={"count": len(ids), "task_ids": ids})
@@ -218,11 +221,14 @@ async def update_task(task_id: int, body: TaskUpdate, user: dict = Depends(get_c
         if task["status"] not in (TaskStatus.PENDING, TaskStatus.PROCESSING):
             logger.warning("Reschedule rejected: task %s status=%s", task_id, task["status"])
             raise HTTPException(status_code=409, detail="Cannot reschedule a task that is already completed or failed")
-        task_repo.update_task_scheduled_at(task_id, body.scheduled_at)
+        if task_repo.update_task_scheduled_at(task_id, body.scheduled_at):
+            wake_scheduler()
         logger.info("Task %s rescheduled to %s", task_id, body.scheduled_at)
 
     if body.status is not None:
-        task_repo.update_task_status(task_id, body.status, error_message=body.error_message)
+        ok = task_repo.update_task_status(task_id, body.status, error_message=body.error_message)
+        if ok and body.status == TaskStatus.PENDING:
+            wake_scheduler()
         logger.info("Task %s status changed to %s", task_id, body.status)
 
     updated = task_repo.get_task(task_id)
@@ -1,8 +1,5 @@
 """YouTube channel ID validation via YouTube Data API v3."""
 
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
-
 from app.core.config import api_settings
 
 
@@ -17,6 +14,11 @@ def validate_channel_id(channel_id: str) -> tuple[bool, str | None]:
     if not api_key:
         return False, "YOUTUBE_API_KEY not configured"
 
+    # Late import: googleapiclient is slow to load and only this path needs it,
+    # so the API process doesn't pay for it at startup.
+    from googleapiclient.discovery import build
+    from googleapiclient.errors import HttpError
+
     try:
         youtube = build("youtube", "v3", developerKey=api_key)
 
@@ -1492,6 +1492,8 @@ async def task_new_submit(
         scheduled_at=scheduled,
         created_by=user["id"],
     )
+    from shared.queue.wake import wake_scheduler
+    wake_scheduler()
     return RedirectResponse("/app/tasks", status_code=302)
 
 
@@ -1520,10 +1522,12 @@ async def channel_retry_all_failed(request: Request, channel_uuid: str):
         return redirect
 
     from shared.db.repositories import task_repo, channel_repo
+    from shared.queue.wake import wake_scheduler
     channel = channel_repo.get_channel_by_uuid(channel_uuid)
     if not channel or (not is_admin(user) and channel.get("created_by") != user["id"]):
         return RedirectResponse("/app/channels", status_code=302)
-    task_repo.retry_all_failed_by_channel(channel["id"])
+    if task_repo.retry_all_failed_by_channel(channel["id"]):
+        wake_scheduler()
     return RedirectResponse(f"/app/channels/{channel_uuid}", status_code=302)
 
 
@@ -1534,10 +1538,12 @@ async def task_retry(request: Request, task_uuid: str):
         return redirect
 
     from shared.db.repositories import task_repo
+    from shared.queue.wake import wake_scheduler
     task = task_repo.get_task_by_uuid(task_uuid)
     if not task or (not is_admin(user) and task.get("created_by") != user["id"]):
         return RedirectResponse("/app/tasks", status_code=302)
-    task_repo.retry_task(task["id"])
+    if task_repo.retry_task(task["id"]):
+        wake_scheduler()
     return RedirectResponse(f"/app/tasks/{task_uuid}", status_code=302)
 
 
@@ -1610,6 +1616,7 @@ async def task_reschedule(
 
     from datetime import datetime
     from shared.db.repositories import task_repo
+    from shared.queue.wake import wake_scheduler
 
     task = task_repo.get_task_by_uuid(task_uuid)
     if not task or (not is_admin(user) and task.get("created_by") != user["id"]):
@@ -1620,7 +1627,8 @@ async def task_reschedule(
     except ValueError:
         return RedirectResponse(f"/app/tasks/{task_uuid}", status_code=302)
 
-    task_repo.update_task_scheduled_at(task["id"], new_time)
+    if task_repo.update_task_scheduled_at(task["id"], new_time):
+        wake_scheduler()
     return RedirectResponse(f"/app/tasks/{task_uuid}", status_code=302)
 
 
@@ -2234,12 +2242,19 @@ async def portal_upload_thumbnail(
 # ── Voice Processing ───────────────────────────────────────────────
 
 import json as _json
-import threading
 import uuid as _voice_uuid
+from concurrent.futures import ThreadPoolExecutor
 
 # In-memory job store (per-process; sufficient for single-worker deploy)
 _voice_jobs: dict[str, dict] = {}
 
+# Voice conversion is CPU/RAM heavy; bound how many run at once in the web
+# process. Extra submissions wait in the executor queue as "Queued...".
+VOICE_MAX_CONCURRENT_JOBS = 2
+_voice_executor = ThreadPoolExecutor(
+    max_workers=VOICE_MAX_CONCURRENT_JOBS, thread_name_prefix="voice"
+)
+
 
 @router.get("/voice", response_class=HTMLResponse)
 async def voice_page(request: Request):
@@ -2387,7 +2402,7 @@ async def voice_process(request: Request):
         "quality": quality,
         "status": "processing",
         "progress": 0,
-        "message": "Starting...",
+        "message": "Queued...",
         "error": None,
         "created_at": datetime.now(timezone.utc).isoformat(),
     }
@@ -2441,8 +2456,7 @@ async def voice_process(request: Request):
             job_data["error"] = str(e)
             job_data["message"] = f"Error: {e}"
 
-    thread = threading.Thread(target=_run_voice_job, args=(job,), daemon=True)
-    thread.start()
+    _voice_executor.submit(_run_voice_job, job)
 
     return JSONResponse({"job_id": job_id, "status": "processing"})
 
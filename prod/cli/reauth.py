@@ -10,42 +10,39 @@ Usage:
     python -m cli.reauth --all
     python -m cli.reauth --channel-id 9 --no-browser   # remote server (print URL only)
     python -m cli.reauth --channel-id 9 --port 9090     # custom callback port
+
+Exits non-zero if any channel failed, so cron/CI wrappers can alert on it.
 """
 
 from __future__ import annotations
 
 import argparse
-import sys
-
-import shared.env  # noqa: F401 — load .env files
-
-from shared.logging_config import setup_logging
-from shared.youtube.reauth.service import YouTubeReauthService, ServiceConfig, OAuthSettings
-from shared.youtube.reauth.models import ReauthStatus
-from shared.db.repositories import channel_repo, audit_repo
-
 import logging
+import sys
+from collections import Counter
 
 logger = logging.getLogger(__name__)
 
+_STATUS_ICONS = {"success": "+", "failed": "X", "skipped": "~"}
+
 
 def get_failed_channel_ids() -> list[int]:
     """Get channel IDs that have recent failed reauth or token errors."""
+    from shared.db.repositories import channel_repo, audit_repo
+
     channels = channel_repo.get_all_channels(enabled_only=True)
+    latest = audit_repo.get_latest_reauth_statuses([ch["id"] for ch in channels])
     failed_ids = []
     for ch in channels:
         if not ch.get("access_token") or not ch.get("refresh_token"):
             failed_ids.append(ch["id"])
             continue
-        audits = audit_repo.get_recent_reauth_audits(ch["id"], limit=1)
-        if audits and audits[0].get("status") in ("failed", "skipped"):
+        if latest.get(ch["id"]) in ("failed", "skipped"):
             failed_ids.append(ch["id"])
     return failed_ids
 
 
-def main() -> None:
-    setup_logging(service_name="cff-reauth")
-
+def main() -> int:
     parser = argparse.ArgumentParser(
         description="YouTube OAuth re-authorization (opens browser for manual auth)"
     )
@@ -65,6 +62,17 @@ def main() -> None:
     parser.add_argument("--timeout", type=int, default=300, help="OAuth timeout in seconds (default: 300)")
     args = parser.parse_args()
 
+    # Late import so --help and argparse errors don't pay for google-auth,
+    # Selenium and the DB layer
+    import shared.env  # noqa: F401 — load .env files
+
+    from shared.db.repositories import channel_repo
+    from shared.logging_config import setup_logging
+    from shared.youtube.reauth.models import ReauthStatus
+    from shared.youtube.reauth.service import YouTubeReauthService, ServiceConfig, OAuthSettings
+
+    setup_logging(service_name="cff-reauth")
+
     if args.channel_id:
         channel_ids = args.channel_id
     elif args.all_failed:
@@ -72,19 +80,18 @@ def main() -> None:
         if not channel_ids:
             logger.info("No channels with failed tokens found")
             print("No channels with failed tokens found.")
-            return
+            return 0
         logger.info("Found %d channels with failed tokens: %s", len(channel_ids), channel_ids)
     elif args.all:
-        channels = channel_repo.get_all_channels(enabled_only=True)
-        channel_ids = [ch["id"] for ch in channels]
+        channel_ids = channel_repo.get_enabled_channel_ids()
         if not channel_ids:
             logger.info("No enabled channels found")
             print("No enabled channels found.")
-            return
+            return 0
         logger.info("Re-authorizing all %d enabled channels", len(channel_ids))
     else:
         parser.print_help()
-        sys.exit(1)
+        return 1
 
     config = ServiceConfig(
         oauth_settings=OAuthSettings(
@@ -103,17 +110,20 @@ def main() -> None:
     service = YouTubeReauthService(service_config=config)
     results = service.run_sync(channel_ids)
 
-    success = sum(1 for r in results if r.status == ReauthStatus.SUCCESS)
-    failed = sum(1 for r in results if r.status == ReauthStatus.FAILED)
-    skipped = sum(1 for r in results if r.status == ReauthStatus.SKIPPED)
+    counts = Counter(r.status for r in results)
+    success = counts[ReauthStatus.SUCCESS]
+    failed = counts[ReauthStatus.FAILED]
+    skipped = counts[ReauthStatus.SKIPPED]
 
-    print(f"\nReauth complete: {success} success, {failed} failed, {skipped} skipped")
+    lines = [f"\nReauth complete: {success} success, {failed} failed, {skipped} skipped"]
     for r in results:
-        status_icon = {"success": "+", "failed": "X", "skipped": "~"}[r.status.value]
-        print(f"  [{status_icon}] {r.channel_name}: {r.status.value}")
+        status = r.status.value
+        lines.append(f"  [{_STATUS_ICONS[status]}] {r.channel_name}: {status}")
         if r.error:
-            print(f"      Error: {r.error}")
+            lines.append(f"      Error: {r.error}")
+    print("\n".join(lines))
+    return 1 if failed else 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
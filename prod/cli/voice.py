@@ -17,8 +17,6 @@ import os
 import sys
 from pathlib import Path
 
-from shared.voice.voice_changer import VoiceChanger
-
 
 def main() -> None:
     parser = argparse.ArgumentParser(
@@ -183,6 +181,9 @@ def main() -> None:
             else:
                 print("   Параллельная обработка: Выкл")
 
+        # Late import so --help and a missing input file don't pay for torch
+        from shared.voice.voice_changer import VoiceChanger
+
         # Determine device
         device = None if args.device == "auto" else args.device
 
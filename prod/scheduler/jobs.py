@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
-from shared.db.models import TaskStatus
 from shared.db.repositories import task_repo, channel_repo, console_repo, stats_repo
 from shared.queue.publisher import (
     enqueue_video_upload,
@@ -24,14 +25,61 @@ from shared.youtube.token_refresh import build_credentials, ensure_fresh_credent
 
 logger = logging.getLogger(__name__)
 
+# Tasks claimed per poll. A full batch means there's likely a backlog.
+ENQUEUE_BATCH_LIMIT = 50
+
+
+def _route_task(t: dict) -> None:
+    """Push one claimed task to its rq queue. Raises if the hand-off fails."""
+    task_id = t.get("id")
+    channel_id = t.get("channel_id")
+    media_type = t.get("media_type")
+
+    # Routing logic:
+    # 1. If source_file_path is empty but it's a DLE task -> route to voice/processing
+    # 2. Otherwise -> route to publishing
+
+    legacy = t.get("legacy_add_info") or {}
+    is_dle = isinstance(legacy, dict) and "dle_source" in legacy
+
+    logger.debug("[SCHEDULER] Evaluating task %d (channel=%d, media=%s, is_dle=%s)", 
+                 task_id, channel_id, media_type, is_dle)
+
+    if not t.get("source_file_path") and is_dle:
+        logger.info("[SCHEDULER] ROUTING: DLE task %d -> [VOICE/PROCESSING QUEUE]", task_id)
+        enqueue_voice_change(VoiceChangePayload(
+            task_id=task_id,
+            source_file_path="",  # Worker will download based on legacy_add_info
+            output_file_path="",  # Worker will decide output path
+            metadata={"is_dle": True}
+        ))
+        logger.debug("[SCHEDULER] Task %d enqueued to voice queue", task_id)
+        return
+
+    # Standard upload path
+    logger.info("[SCHEDULER] ROUTING: Task %d -> [PUBLISHING QUEUE]", task_id)
+    enqueue_video_upload(VideoUploadPayload(
+        task_id=task_id,
+        channel_id=channel_id,
+        source_file_path=t["source_file_path"] or "",
+        title=t["title"] or "",
+        description=t.get("description"),
+        keywords=t.get("keywords"),
+        thumbnail_path=t.get("thumbnail_path"),
+        post_comment=t.get("post_comment"),
+        media_type=media_type or "video",
+    ))
+    logger.info("[SCHEDULER] SUCCESS: Task %d enqueued for channel %d", task_id, channel_id)
+
 
 def enqueue_pending_tasks() -> int:
-    """Find pending tasks (status=0, scheduled_at <= NOW) and push to Redis.
+    """Claim pending tasks (status=0, scheduled_at <= NOW) and push to Redis.
 
     Returns the number of tasks enqueued.
     """
     logger.debug("[SCHEDULER] Polling for pending tasks...")
-    tasks = task_repo.get_pending_tasks(limit=50)
+    # Claimed tasks are already PROCESSING; failed hand-offs are requeued below.
+    tasks = task_repo.claim_pending_tasks(limit=ENQUEUE_BATCH_LIMIT)
     if not tasks:
         logger.debug("[SCHEDULER] 0 pending tasks found")
         return 0
@@ -39,69 +87,81 @@ def enqueue_pending_tasks() -> int:
     logger.info("[SCHEDULER] Found %d pending tasks to enqueue", len(tasks))
 
     count = 0
-    for t in tasks:
-        task_id = t.get("id")
-        channel_id = t.get("channel_id")
-        media_type = t.get("media_type")
-        
-        try:
-            # Routing logic:
-            # 1. If source_file_path is empty but it's a DLE task -> route to voice/processing
-            # 2. Otherwise -> route to publishing
-            
-            legacy = t.get("legacy_add_info") or {}
-            is_dle = isinstance(legacy, dict) and "dle_source" in legacy
-            
-            logger.debug("[SCHEDULER] Evaluating task %d (channel=%d, media=%s, is_dle=%s)", 
-                         task_id, channel_id, media_type, is_dle)
-            
-            if not t.get("source_file_path") and is_dle:
-                logger.info("[SCHEDULER] ROUTING: DLE task %d -> [VOICE/PROCESSING QUEUE]", task_id)
-                task_repo.mark_task_processing(task_id)
-                enqueue_voice_change(VoiceChangePayload(
-                    task_id=task_id,
-                    source_file_path="",  # Worker will download based on legacy_add_info
-                    output_file_path="",  # Worker will decide output path
-                    metadata={"is_dle": True}
-                ))
+    # Claimed ids not yet enqueued or requeued. Whatever is left when the loop
+    # exits (an unexpected error, a failed requeue) goes back to PENDING so it
+    # can't sit in PROCESSING with no rq job behind it.
+    unhandled = {t["id"] for t in tasks}
+    try:
+        for t in tasks:
+            task_id = t["id"]
+            try:
+                _route_task(t)
                 count += 1
-                logger.debug("[SCHEDULER] Task %d enqueued to voice queue", task_id)
-                continue
-
-            # Standard upload path
-            logger.info("[SCHEDULER] ROUTING: Task %d -> [PUBLISHING QUEUE]", task_id)
-            task_repo.mark_task_processing(task_id)
-            enqueue_video_upload(VideoUploadPayload(
-                task_id=task_id,
-                channel_id=channel_id,
-                source_file_path=t["source_file_path"] or "",
-                title=t["title"] or "",
-                description=t.get("description"),
-                keywords=t.get("keywords"),
-                thumbnail_path=t.get("thumbnail_path"),
-                post_comment=t.get("post_comment"),
-                media_type=media_type or "video",
-            ))
-            count += 1
-            logger.info("[SCHEDULER] SUCCESS: Task %d enqueued for channel %d", task_id, channel_id)
-        except Exception as e:
-            logger.error("[SCHEDULER] FAILED to enqueue task %d: %s", task_id, e)
-            # Reset back to pending so it can be retried
-            task_repo.update_task_status(task_id, TaskStatus.PENDING.value)
+            except Exception as e:
+                attempts = t.get("enqueue_attempts") or 0
+                logger.error("[SCHEDULER] FAILED to enqueue task %d (attempt %d): %s", task_id, attempts + 1, e)
+                # A failed hand-off is an infrastructure error, not the task's fault:
+                # never fail the task for it, just back off (capped) and retry.
+                try:
+                    task_repo.requeue_task(task_id, attempts)
+                except Exception:
+                    logger.exception("[SCHEDULER] Could not requeue task %d", task_id)
+                    continue
+            unhandled.discard(task_id)
+    finally:
+        if unhandled:
+            try:
+                released = task_repo.release_claimed_tasks(sorted(unhandled))
+                logger.warning("[SCHEDULER] Released %d claimed tasks back to pending", released)
+            except Exception:
+                logger.exception("[SCHEDULER] Could not release claimed tasks %s", sorted(unhandled))
 
     if count > 0:
         logger.info("[SCHEDULER] Evaluation complete: %d tasks successfully routed", count)
     return count
 
 
+TOKEN_CHECK_WORKERS = 8  # refreshes are network-bound; stays within the DB pool (5 + 10 overflow)
+# Channels that passed a check more recently than this are skipped, so a
+# scheduler restart doesn't re-refresh every token; still < 24h for the daily run.
+TOKEN_RECHECK_HOURS = 20
+
+
+def _check_channel_token(ch: dict, console: dict | None) -> bool:
+    """Refresh one channel's credentials and record the outcome in the DB."""
+    try:
+        if not console:
+            logger.warning("Channel %s (%s): console_id=%s not found",
+                           ch["id"], ch["name"], ch["console_id"])
+            channel_repo.update_token_check(ch["id"], ok=False)
+            return False
+
+        creds = build_credentials(
+            access_token=ch["access_token"],
+            refresh_token=ch["refresh_token"],
+            client_id=console["client_id"],
+            client_secret=console["client_secret"],
+            token_expires_at=ch["token_expires_at"],
+        )
+        ensure_fresh_credentials(creds, channel_id=ch["id"])
+        channel_repo.update_token_check(ch["id"], ok=True)
+        logger.info("Token OK: channel %s (%s)", ch["id"], ch["name"])
+        return True
+    except Exception:
+        logger.exception("Token FAILED: channel %s (%s)", ch["id"], ch["name"])
+        channel_repo.update_token_check(ch["id"], ok=False)
+        return False
+
+
 def validate_channel_tokens() -> tuple[int, int]:
     """Try to refresh credentials for all enabled channels with tokens.
 
+    Channels are checked concurrently (each check is an OAuth round-trip).
     Returns (success_count, failure_count).
     """
-    channels = channel_repo.get_channels_with_tokens()
+    channels = channel_repo.get_channels_with_tokens(stale_after_hours=TOKEN_RECHECK_HOURS)
     if not channels:
-        logger.info("Token validation: no channels with tokens found")
+        logger.info("Token validation: no channels with tokens due for a check")
         # Still push (empty) gauge so dashboard knows the job ran.
         try:
             from shared.metrics import push_youtube_token_expiries
@@ -110,33 +170,16 @@ def validate_channel_tokens() -> tuple[int, int]:
             logger.exception("push_youtube_token_expiries failed")
         return 0, 0
 
+    consoles = console_repo.get_consoles_by_ids(ch["console_id"] for ch in channels)
     success = 0
-    failure = 0
-    for ch in channels:
-        try:
-            console = console_repo.get_console_by_id(ch["console_id"])
-            if not console:
-                logger.warning("Channel %s (%s): console_id=%s not found",
-                               ch["id"], ch["name"], ch["console_id"])
-                channel_repo.update_token_check(ch["id"], ok=False)
-                failure += 1
-                continue
-
-            creds = build_credentials(
-                access_token=ch["access_token"],
-                refresh_token=ch["refresh_token"],
-                client_id=console["client_id"],
-                client_secret=console["client_secret"],
-                token_expires_at=ch["token_expires_at"],
-            )
-            ensure_fresh_credentials(creds, channel_id=ch["id"])
-            channel_repo.update_token_check(ch["id"], ok=True)
-            success += 1
-            logger.info("Token OK: channel %s (%s)", ch["id"], ch["name"])
-        except Exception:
-            logger.exception("Token FAILED: channel %s (%s)", ch["id"], ch["name"])
-            channel_repo.update_token_check(ch["id"], ok=False)
-            failure += 1
+    with ThreadPoolExecutor(max_workers=min(TOKEN_CHECK_WORKERS, len(channels))) as pool:
+        for ok in pool.map(
+            _check_channel_token,
+            channels,
+            [consoles.get(ch["console_id"]) for ch in channels],
+        ):
+            success += ok
+    failure = len(channels) - success
 
     logger.info("Token validation: %d ok, %d failed", success, failure)
 
@@ -153,6 +196,18 @@ def validate_channel_tokens() -> tuple[int, int]:
     return success, failure
 
 
+@functools.lru_cache(maxsize=4)
+def _youtube_data_api(api_key: str):
+    """Return the YouTube Data API client for *api_key*, building it on first use.
+
+    Both daily stats jobs share one client per key so googleapiclient is
+    imported and the discovery document parsed once per scheduler process,
+    not per job. A rotated key gets its own client.
+    """
+    from googleapiclient.discovery import build as yt_build
+    return yt_build("youtube", "v3", developerKey=api_key)
+
+
 def collect_channel_stats() -> tuple[int, int]:
     """Fetch YouTube channel statistics for all channels and store daily snapshots.
 
@@ -171,8 +226,7 @@ def collect_channel_stats() -> tuple[int, int]:
         logger.info("Stats collection: no enabled channels")
         return 0, 0
 
-    from googleapiclient.discovery import build as yt_build
-    youtube = yt_build("youtube", "v3", developerKey=api_key)
+    youtube = _youtube_data_api(api_key)
 
     success = 0
     failure = 0
@@ -237,8 +291,7 @@ def collect_video_stats() -> tuple[int, int]:
         logger.info("Video stats collection: no completed tasks with upload_id")
         return 0, 0
 
-    from googleapiclient.discovery import build as yt_build
-    youtube = yt_build("youtube", "v3", developerKey=api_key)
+    youtube = _youtube_data_api(api_key)
 
     success = 0
     failure = 0
@@ -1,4 +1,4 @@
-"""Scheduler entry point — polls DB every 60s for pending tasks."""
+"""Scheduler entry point — polls DB every 60s for pending tasks, or sooner when woken."""
 
 from __future__ import annotations
 
@@ -10,6 +10,7 @@ from datetime import date
 import shared.env  # noqa: F401 — load .env files before anything else
 
 from scheduler.jobs import (
+    ENQUEUE_BATCH_LIMIT,
     enqueue_pending_tasks,
     validate_channel_tokens,
     collect_channel_stats,
@@ -18,6 +19,7 @@ from scheduler.jobs import (
     reconcile_streams,
 )
 from shared.logging_config import setup_logging
+from shared.queue.wake import wait_for_wake
 
 POLL_INTERVAL = 60  # seconds
 
@@ -31,6 +33,16 @@ def _handle_signal(signum, frame):
     _running = False
 
 
+def _idle(seconds: int) -> None:
+    """Wait until the next cycle, returning early on shutdown or a wake-up."""
+    deadline = time.monotonic() + seconds
+    # 1s slices keep shutdown responsive, same as the plain sleep loop did.
+    while _running and time.monotonic() < deadline:
+        if wait_for_wake(1):
+            logger.debug("Woken up early: new tasks signalled")
+            return
+
+
 def main() -> None:
     setup_logging(service_name="cff-scheduler")
     signal.signal(signal.SIGINT, _handle_signal)
@@ -42,6 +54,7 @@ def main() -> None:
     last_stats_date: date | None = None
 
     while _running:
+        count = 0
         try:
             count = enqueue_pending_tasks()
             if count:
@@ -94,11 +107,9 @@ def main() -> None:
 
             last_stats_date = today
 
-        # Sleep in small increments to allow graceful shutdown
-        for _ in range(POLL_INTERVAL):
-            if not _running:
-                break
-            time.sleep(1)
+        # A full batch means more tasks are probably due: poll again right away.
+        if count < ENQUEUE_BATCH_LIMIT:
+            _idle(POLL_INTERVAL)
 
     logger.info("Scheduler stopped")
 
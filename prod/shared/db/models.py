@@ -192,6 +192,8 @@ content_upload_queue_tasks = Table(
     Column("upload_url", String(500)),
     Column("retry_count", Integer, nullable=False, server_default="0"),
     Column("max_retries", Integer, nullable=False, server_default="3"),
+    Column("enqueue_attempts", Integer, nullable=False, server_default="0"),
+    Column("next_attempt_at", DateTime),
     Column("error_message", Text),
     Column("error_code", String(100)),
     Column("legacy_add_info", Text),
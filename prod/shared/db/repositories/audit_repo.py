@@ -6,7 +6,7 @@ import logging
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import select, insert, text
+from sqlalchemy import func, select, insert, text
 
 from shared.db.connection import get_connection
 from shared.db.models import channel_reauth_audit_logs
@@ -101,6 +101,26 @@ def get_recent_reauth_audits(
     return [_row_to_dict(r) for r in rows]
 
 
+def get_latest_reauth_statuses(channel_ids: list[int]) -> dict[int, str]:
+    """Latest audit status per channel in one query. Channels without audits are omitted."""
+    if not channel_ids:
+        return {}
+    t = channel_reauth_audit_logs
+    rn = func.row_number().over(
+        partition_by=t.c.channel_id,
+        order_by=t.c.initiated_at.desc(),
+    ).label("rn")
+    ranked = (
+        select(t.c.channel_id, t.c.status, rn)
+        .where(t.c.channel_id.in_(channel_ids))
+        .subquery()
+    )
+    stmt = select(ranked.c.channel_id, ranked.c.status).where(ranked.c.rn == 1)
+    with get_connection() as conn:
+        rows = conn.execute(stmt).fetchall()
+    return {row[0]: row[1] for row in rows}
+
+
 def _row_to_dict(row) -> dict[str, Any]:
     return {
         "id": row[0],
@@ -6,7 +6,7 @@ import logging
 import uuid as _uuid
 from typing import Any
 
-from sqlalchemy import select, insert, text
+from sqlalchemy import bindparam, func, insert, or_, select, text
 
 from shared.db.connection import get_connection
 from shared.db.models import (
@@ -19,24 +19,33 @@ from shared.db.utils import is_duplicate_key_error, serialize_json
 
 logger = logging.getLogger(__name__)
 
+# Full channel row, shared by list/get. Lookup statements are built once so
+# per-call work is just binding the key.
+_CHANNEL_COLS = (
+    platform_channels.c.id,
+    platform_channels.c.uuid,
+    platform_channels.c.name,
+    platform_channels.c.platform_channel_id,
+    platform_channels.c.console_id,
+    platform_channels.c.enabled,
+    platform_channels.c.project_id,
+    platform_channels.c.access_token,
+    platform_channels.c.refresh_token,
+    platform_channels.c.token_expires_at,
+    platform_channels.c.created_by,
+    platform_channels.c.created_at,
+    platform_channels.c.updated_at,
+)
+_CHANNEL_BY_ID_STMT = select(*_CHANNEL_COLS).where(
+    platform_channels.c.id == bindparam("channel_id")
+)
+_CHANNEL_BY_UUID_STMT = select(*_CHANNEL_COLS).where(
+    platform_channels.c.uuid == bindparam("uuid")
+)
+
 
 def list_channels(project_id: int | None = None) -> list[dict[str, Any]]:
-    cols = [
-        platform_channels.c.id,
-        platform_channels.c.uuid,
-        platform_channels.c.name,
-        platform_channels.c.platform_channel_id,
-        platform_channels.c.console_id,
-        platform_channels.c.enabled,
-        platform_channels.c.project_id,
-        platform_channels.c.access_token,
-        platform_channels.c.refresh_token,
-        platform_channels.c.token_expires_at,
-        platform_channels.c.created_by,
-        platform_channels.c.created_at,
-        platform_channels.c.updated_at,
-    ]
-    stmt = select(*cols).order_by(platform_channels.c.created_at.desc())
+    stmt = select(*_CHANNEL_COLS).order_by(platform_channels.c.created_at.desc())
     if project_id is not None:
         stmt = stmt.where(platform_channels.c.project_id == project_id)
 
@@ -59,24 +68,8 @@ def list_channels(project_id: int | None = None) -> list[dict[str, Any]]:
 
 
 def get_channel_by_id(channel_id: int) -> dict[str, Any] | None:
-    cols = [
-        platform_channels.c.id,
-        platform_channels.c.uuid,
-        platform_channels.c.name,
-        platform_channels.c.platform_channel_id,
-        platform_channels.c.console_id,
-        platform_channels.c.enabled,
-        platform_channels.c.project_id,
-        platform_channels.c.access_token,
-        platform_channels.c.refresh_token,
-        platform_channels.c.token_expires_at,
-        platform_channels.c.created_by,
-        platform_channels.c.created_at,
-        platform_channels.c.updated_at,
-    ]
-    stmt = select(*cols).where(platform_channels.c.id == channel_id)
     with get_connection() as conn:
-        row = conn.execute(stmt).fetchone()
+        row = conn.execute(_CHANNEL_BY_ID_STMT, {"channel_id": channel_id}).fetchone()
     if not row:
         return None
     return {
@@ -90,24 +83,8 @@ def get_channel_by_id(channel_id: int) -> dict[str, Any] | None:
 
 
 def get_channel_by_uuid(uuid: str) -> dict[str, Any] | None:
-    cols = [
-        platform_channels.c.id,
-        platform_channels.c.uuid,
-        platform_channels.c.name,
-        platform_channels.c.platform_channel_id,
-        platform_channels.c.console_id,
-        platform_channels.c.enabled,
-        platform_channels.c.project_id,
-        platform_channels.c.access_token,
-        platform_channels.c.refresh_token,
-        platform_channels.c.token_expires_at,
-        platform_channels.c.created_by,
-        platform_channels.c.created_at,
-        platform_channels.c.updated_at,
-    ]
-    stmt = select(*cols).where(platform_channels.c.uuid == uuid)
     with get_connection() as conn:
-        row = conn.execute(stmt).fetchone()
+        row = conn.execute(_CHANNEL_BY_UUID_STMT, {"uuid": uuid}).fetchone()
     if not row:
         return None
     return {
@@ -142,6 +119,33 @@ def get_channel_by_name(name: str) -> dict[str, Any] | None:
     }
 
 
+def get_channel_oauth(channel_id: int) -> dict[str, Any] | None:
+    """Channel tokens plus its console's OAuth client in one query.
+
+    client_id/client_secret are None when the channel has no console.
+    """
+    ch = platform_channels
+    oc = platform_oauth_credentials
+    stmt = (
+        select(
+            ch.c.id, ch.c.name, ch.c.console_id, ch.c.enabled,
+            ch.c.access_token, ch.c.refresh_token, ch.c.token_expires_at,
+            oc.c.client_id, oc.c.client_secret,
+        )
+        .select_from(ch.outerjoin(oc, oc.c.id == ch.c.console_id))
+        .where(ch.c.id == channel_id)
+    )
+    with get_connection() as conn:
+        row = conn.execute(stmt).fetchone()
+    if not row:
+        return None
+    return {
+        "id": row[0], "name": row[1], "console_id": row[2], "enabled": bool(row[3]),
+        "access_token": row[4], "refresh_token": row[5], "token_expires_at": row[6],
+        "client_id": row[7], "client_secret": row[8],
+    }
+
+
 def channel_exists_by_name(name: str) -> bool:
     stmt = select(platform_channels.c.id).where(
         platform_channels.c.name == name
@@ -187,6 +191,18 @@ def get_all_channels(enabled_only: bool = False) -> list[dict[str, Any]]:
     ]
 
 
+def get_enabled_channel_ids() -> list[int]:
+    """IDs of enabled channels, ordered by name (no token columns fetched)."""
+    stmt = (
+        select(platform_channels.c.id)
+        .where(platform_channels.c.enabled == 1)
+        .order_by(platform_channels.c.name)
+    )
+    with get_connection() as conn:
+        rows = conn.execute(stmt).fetchall()
+    return [r[0] for r in rows]
+
+
 def get_default_project_id() -> int | None:
     stmt = select(platform_projects.c.id).where(
         platform_projects.c.slug == "default"
@@ -300,8 +316,12 @@ def update_login_credentials(
         return result.rowcount > 0
 
 
-def get_channels_with_tokens() -> list[dict[str, Any]]:
-    """Return enabled channels that have OAuth tokens and a console_id."""
+def get_channels_with_tokens(stale_after_hours: int | None = None) -> list[dict[str, Any]]:
+    """Return enabled channels that have OAuth tokens and a console_id.
+
+    With *stale_after_hours*, channels whose last token check passed within
+    that window are left out; failed and never-checked channels are always kept.
+    """
     cols = [
         platform_channels.c.id,
         platform_channels.c.name,
@@ -317,6 +337,14 @@ def get_channels_with_tokens() -> list[dict[str, Any]]:
         .where(platform_channels.c.refresh_token.isnot(None))
         .where(platform_channels.c.console_id.isnot(None))
     )
+    if stale_after_hours is not None:
+        cutoff = func.date_sub(func.now(), text("INTERVAL :h HOUR").bindparams(h=stale_after_hours))
+        stmt = stmt.where(or_(
+            platform_channels.c.token_check_ok.is_(None),
+            platform_channels.c.token_check_ok == 0,
+            platform_channels.c.token_checked_at.is_(None),
+            platform_channels.c.token_checked_at < cutoff,
+        ))
     with get_connection() as conn:
         rows = conn.execute(stmt).fetchall()
     return [
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, Iterable
 
 from sqlalchemy import select, insert, text
 
@@ -64,6 +64,17 @@ def get_console_by_id(console_id: int) -> dict[str, Any] | None:
     return _row_to_dict(row)
 
 
+def get_consoles_by_ids(console_ids: Iterable[int]) -> dict[int, dict[str, Any]]:
+    """Load several consoles in one query, keyed by id. Missing ids are omitted."""
+    ids = list(set(console_ids))
+    if not ids:
+        return {}
+    stmt = select(*_CONSOLE_COLS).where(_t.c.id.in_(ids))
+    with get_connection() as conn:
+        rows = conn.execute(stmt).fetchall()
+    return {r[0]: _row_to_dict(r) for r in rows}
+
+
 def get_console_by_name(name: str) -> dict[str, Any] | None:
     stmt = select(*_CONSOLE_COLS).where(_t.c.name == name)
     with get_connection() as conn:
@@ -15,6 +15,61 @@ from shared.db.utils import serialize_json, deserialize_json, truncate_error
 
 logger = logging.getLogger(__name__)
 
+# Requeue backoff: BASE * 2**enqueue_attempts seconds, capped at MAX.
+REQUEUE_BACKOFF_BASE_SEC = 30
+REQUEUE_BACKOFF_MAX_SEC = 3600
+
+# Static statements, built once at import rather than on every call.
+_UPDATE_STATUS_SQL = text(
+    "UPDATE content_upload_queue_tasks "
+    "SET status = :status, completed_at = :completed_at, error_message = :error_message "
+    "WHERE id = :tid"
+)
+# Back to PENDING by hand: drop any requeue backoff and enqueue-attempt count,
+# same as a manual retry, so the task is due right away.
+_RESET_PENDING_SQL = text(
+    "UPDATE content_upload_queue_tasks "
+    "SET status = 0, completed_at = :completed_at, error_message = :error_message, "
+    "next_attempt_at = NULL, enqueue_attempts = 0 "
+    "WHERE id = :tid"
+)
+_MARK_COMPLETED_SQL = text(
+    "UPDATE content_upload_queue_tasks "
+    "SET status = 1, completed_at = :completed_at, upload_id = :upload_id "
+    "WHERE id = :tid"
+)
+_UPDATE_UPLOAD_ID_SQL = text(
+    "UPDATE content_upload_queue_tasks SET upload_id = :uid WHERE id = :tid"
+)
+_RETRY_TASK_SQL = text(
+    "UPDATE content_upload_queue_tasks "
+    "SET status = 0, error_message = NULL, next_attempt_at = NULL, enqueue_attempts = 0, "
+    "retry_count = retry_count + 1 "
+    "WHERE id = :tid AND status IN (2, 4)"
+)
+_RETRY_CHANNEL_SQL = text(
+    "UPDATE content_upload_queue_tasks "
+    "SET status = 0, error_message = NULL, next_attempt_at = NULL, enqueue_attempts = 0, "
+    "retry_count = retry_count + 1 "
+    "WHERE channel_id = :cid AND status IN (2, 4)"
+)
+_REQUEUE_TASK_SQL = text(
+    "UPDATE content_upload_queue_tasks "
+    "SET status = 0, "
+    "next_attempt_at = NOW() + INTERVAL :delay SECOND, "
+    "enqueue_attempts = enqueue_attempts + 1 "
+    "WHERE id = :tid"
+)
+_CANCEL_TASK_SQL = text(
+    "UPDATE content_upload_queue_tasks "
+    "SET status = 4 WHERE id = :tid AND status IN (0, 3)"
+)
+_RESCHEDULE_SQL = text(
+    "UPDATE content_upload_queue_tasks "
+    "SET scheduled_at = :scheduled_at WHERE id = :tid AND status IN (0, 3)"
+)
+_DELETE_TASK_SQL = text("DELETE FROM content_upload_queue_tasks WHERE id = :tid")
+
 
 def get_default_project_id() -> int | None:
     stmt = select(platform_projects.c.id).where(
@@ -101,6 +156,21 @@ def get_task_by_uuid(uuid: str) -> dict[str, Any] | None:
     return _row_to_dict(row)
 
 
+def get_tasks_by_ids(task_ids: list[int]) -> list[dict[str, Any]]:
+    """Fetch several tasks in one query, returned in the order of *task_ids*.
+
+    Ids with no matching row are skipped.
+    """
+    if not task_ids:
+        return []
+    t = content_upload_queue_tasks
+    stmt = select(*_task_cols()).where(t.c.id.in_(task_ids))
+    with get_connection() as conn:
+        rows = conn.execute(stmt).fetchall()
+    by_id = {r[0]: _row_to_dict(r) for r in rows}
+    return [by_id[tid] for tid in task_ids if tid in by_id]
+
+
 def get_pending_tasks(limit: int | None = None) -> list[dict[str, Any]]:
     """Get tasks with status=0 and scheduled_at <= NOW()."""
     t = content_upload_queue_tasks
@@ -116,6 +186,62 @@ def get_pending_tasks(limit: int | None = None) -> list[dict[str, Any]]:
     return [_row_to_dict(r) for r in rows]
 
 
+def claim_pending_tasks(limit: int) -> list[dict[str, Any]]:
+    """Atomically take up to *limit* due tasks and move them to PROCESSING.
+
+    Rows are locked with ``FOR UPDATE SKIP LOCKED``, so concurrent callers
+    each get a disjoint set instead of racing on the same tasks. Requeued
+    tasks still inside their backoff window are skipped.
+    """
+    t = content_upload_queue_tasks
+    stmt = (
+        select(*_task_cols(), t.c.enqueue_attempts)
+        .where(
+            t.c.status == TaskStatus.PENDING.value,
+            t.c.scheduled_at <= func.now(),
+            or_(t.c.next_attempt_at.is_(None), t.c.next_attempt_at <= func.now()),
+        )
+        .order_by(t.c.scheduled_at.asc())
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    with get_connection() as conn:
+        rows = conn.execute(stmt).fetchall()
+        if not rows:
+            return []
+        ids = [r[0] for r in rows]
+        conn.execute(
+            t.update()
+            .where(t.c.id.in_(ids))
+            .values(status=TaskStatus.PROCESSING.value, completed_at=None, error_message=None)
+        )
+    tasks = []
+    for r in rows:
+        task = _row_to_dict(r)
+        task["status"] = TaskStatus.PROCESSING.value
+        task["enqueue_attempts"] = r[-1]
+        tasks.append(task)
+    return tasks
+
+
+def release_claimed_tasks(task_ids: list[int]) -> int:
+    """Return claimed tasks that were never handed off to PENDING.
+
+    Only rows still in PROCESSING are touched, so a task a worker has
+    already picked up is left alone. Returns the number released.
+    """
+    if not task_ids:
+        return 0
+    t = content_upload_queue_tasks
+    with get_connection() as conn:
+        result = conn.execute(
+            t.update()
+            .where(t.c.id.in_(task_ids), t.c.status == TaskStatus.PROCESSING.value)
+            .values(status=TaskStatus.PENDING.value)
+        )
+        return result.rowcount
+
+
 def get_all_tasks(
     status: int | None = None,
     statuses: list[int] | None = None,
@@ -213,18 +339,20 @@ def update_task_status(
 ) -> bool:
     if completed_at is None and status in (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED):
         completed_at = datetime.now()
-    sql = text(
-        "UPDATE content_upload_queue_tasks "
-        "SET status = :status, completed_at = :completed_at, error_message = :error_message "
-        "WHERE id = :tid"
-    )
     with get_connection() as conn:
-        result = conn.execute(sql, {
-            "status": int(status),
-            "completed_at": completed_at,
-            "error_message": error_message,
-            "tid": task_id,
-        })
+        if status == TaskStatus.PENDING:
+            result = conn.execute(_RESET_PENDING_SQL, {
+                "completed_at": completed_at,
+                "error_message": error_message,
+                "tid": task_id,
+            })
+        else:
+            result = conn.execute(_UPDATE_STATUS_SQL, {
+                "status": int(status),
+                "completed_at": completed_at,
+                "error_message": error_message,
+                "tid": task_id,
+            })
         ok = result.rowcount > 0
         logger.info("Task %s status → %s (ok=%s, error=%s)", task_id, status, ok, truncate_error(error_message))
         return ok
@@ -248,13 +376,8 @@ def mark_task_processing(task_id: int) -> bool:
 def mark_task_completed(task_id: int, upload_id: str | None = None) -> bool:
     logger.info("Marking task %s completed (upload_id=%s)", task_id, upload_id)
     completed_at = datetime.now()
-    sql = text(
-        "UPDATE content_upload_queue_tasks "
-        "SET status = 1, completed_at = :completed_at, upload_id = :upload_id "
-        "WHERE id = :tid"
-    )
     with get_connection() as conn:
-        result = conn.execute(sql, {
+        result = conn.execute(_MARK_COMPLETED_SQL, {
             "completed_at": completed_at,
             "upload_id": upload_id,
             "tid": task_id,
@@ -294,57 +417,49 @@ def _notify_task(task_id: int, ntype: str, prefix: str, upload_id: str | None =
 
 
 def update_task_upload_id(task_id: int, upload_id: str) -> bool:
-    sql = text(
-        "UPDATE content_upload_queue_tasks SET upload_id = :uid WHERE id = :tid"
-    )
     with get_connection() as conn:
-        result = conn.execute(sql, {"uid": upload_id, "tid": task_id})
+        result = conn.execute(_UPDATE_UPLOAD_ID_SQL, {"uid": upload_id, "tid": task_id})
         return result.rowcount > 0
 
 
 def retry_task(task_id: int) -> bool:
     """Reset a failed/cancelled task back to pending."""
-    sql = text(
-        "UPDATE content_upload_queue_tasks "
-        "SET status = 0, error_message = NULL, retry_count = retry_count + 1 "
-        "WHERE id = :tid AND status IN (2, 4)"
-    )
     with get_connection() as conn:
-        result = conn.execute(sql, {"tid": task_id})
+        result = conn.execute(_RETRY_TASK_SQL, {"tid": task_id})
+        return result.rowcount > 0
+
+
+def requeue_task(task_id: int, enqueue_attempts: int = 0) -> bool:
+    """Put a task back to pending after a failed hand-off, counting the attempt.
+
+    *enqueue_attempts* is the task's failed hand-offs before this one (as
+    returned by claim_pending_tasks). The task isn't claimed again until its
+    exponential backoff has passed; manual retries don't lengthen it.
+    """
+    delay = min(REQUEUE_BACKOFF_MAX_SEC, REQUEUE_BACKOFF_BASE_SEC * 2 ** enqueue_attempts)
+    with get_connection() as conn:
+        result = conn.execute(_REQUEUE_TASK_SQL, {"tid": task_id, "delay": delay})
         return result.rowcount > 0
 
 
 def retry_all_failed_by_channel(channel_id: int) -> int:
     """Reset all failed/cancelled tasks for a channel back to pending."""
-    sql = text(
-        "UPDATE content_upload_queue_tasks "
-        "SET status = 0, error_message = NULL, retry_count = retry_count + 1 "
-        "WHERE channel_id = :cid AND status IN (2, 4)"
-    )
     with get_connection() as conn:
-        result = conn.execute(sql, {"cid": channel_id})
+        result = conn.execute(_RETRY_CHANNEL_SQL, {"cid": channel_id})
         return result.rowcount
 
 
 def cancel_task(task_id: int) -> bool:
     """Cancel a task (set status=4). Only allowed if status in (0, 3)."""
-    sql = text(
-        "UPDATE content_upload_queue_tasks "
-        "SET status = 4 WHERE id = :tid AND status IN (0, 3)"
-    )
     with get_connection() as conn:
-        result = conn.execute(sql, {"tid": task_id})
+        result = conn.execute(_CANCEL_TASK_SQL, {"tid": task_id})
         return result.rowcount > 0
 
 
 def update_task_scheduled_at(task_id: int, scheduled_at: datetime) -> bool:
     """Reschedule a task. Only allowed if status in (0, 3)."""
-    sql = text(
-        "UPDATE content_upload_queue_tasks "
-        "SET scheduled_at = :scheduled_at WHERE id = :tid AND status IN (0, 3)"
-    )
     with get_connection() as conn:
-        result = conn.execute(sql, {"scheduled_at": scheduled_at, "tid": task_id})
+        result = conn.execute(_RESCHEDULE_SQL, {"scheduled_at": scheduled_at, "tid": task_id})
         return result.rowcount > 0
 
 
@@ -382,9 +497,8 @@ def create_tasks_batch(tasks: list[dict[str, Any]]) -> list[int]:
 
 
 def delete_task(task_id: int) -> bool:
-    sql = text("DELETE FROM content_upload_queue_tasks WHERE id = :tid")
     with get_connection() as conn:
-        result = conn.execute(sql, {"tid": task_id})
+        result = conn.execute(_DELETE_TASK_SQL, {"tid": task_id})
         return result.rowcount > 0
 
 
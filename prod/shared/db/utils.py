@@ -24,6 +24,8 @@ def deserialize_json(raw: str | dict | list | None, default=None):
         return default
     if not isinstance(raw, str):
         return raw
+    # stdlib json, not orjson: orjson rejects NaN/Infinity and turns ints
+    # wider than 64 bits into floats, which would change legacy rows.
     try:
         return json.loads(raw)
     except (json.JSONDecodeError, TypeError):
@@ -61,4 +63,4 @@ def truncate_error(msg: str | None, length: int = MAX_ERROR_LOG_LENGTH) -> str |
     """Truncate error message for logging."""
     if not msg:
         return None
-    return msg[:length] if len(msg) > length else msg
+    return msg[:length]
@@ -333,8 +333,8 @@ def sample_dle_source_health() -> None:
         logger.debug("sample_dle_source_health failed: %s", exc)
 
 
-def sample_youtube_token_expiries() -> None:
-    """Read token_expires_at from platform_channels, update gauge.
+def _youtube_token_expiries() -> list[tuple[str, float]]:
+    """Return (channel_name, seconds_until_expiry) for enabled YouTube channels.
 
     `token_expires_at` is stored as naive UTC (all writers use either
     google-auth's naive UTC `creds.expiry` or `datetime.now(timezone.utc)`
@@ -343,28 +343,34 @@ def sample_youtube_token_expiries() -> None:
     local time**, which on MSK servers (UTC+3) makes every token look 3h
     expired. Tag the value as UTC before timestamp().
     """
+    from datetime import timezone as _tz
+    from shared.db.connection import get_connection
+    from sqlalchemy import text
+
+    with get_connection() as conn:
+        rows = conn.execute(text("""
+            SELECT name, token_expires_at
+            FROM platform_channels
+            WHERE platform = 'youtube' AND enabled = 1 AND access_token IS NOT NULL
+              AND token_expires_at IS NOT NULL
+        """)).fetchall()
+    now = time.time()
+    out: list[tuple[str, float]] = []
+    for name, expires in rows:
+        try:
+            if expires.tzinfo is None:
+                expires = expires.replace(tzinfo=_tz.utc)
+            out.append((str(name), expires.timestamp() - now))
+        except AttributeError:
+            continue
+    return out
+
+
+def sample_youtube_token_expiries() -> None:
+    """Read token_expires_at from platform_channels, update gauge."""
     try:
-        from datetime import timezone as _tz
-        from shared.db.connection import get_connection
-        from sqlalchemy import text
-        now = time.time()
-        with get_connection() as conn:
-            rows = conn.execute(text("""
-                SELECT name, token_expires_at
-                FROM platform_channels
-                WHERE platform = 'youtube' AND enabled = 1 AND access_token IS NOT NULL
-            """)).fetchall()
-        for r in rows:
-            name, expires = r
-            if expires is None:
-                continue
-            try:
-                if expires.tzinfo is None:
-                    expires = expires.replace(tzinfo=_tz.utc)
-                ts = expires.timestamp()
-            except AttributeError:
-                continue
-            youtube_token_expires_in_seconds.labels(channel=str(name)).set(ts - now)
+        for name, expires_in in _youtube_token_expiries():
+            youtube_token_expires_in_seconds.labels(channel=name).set(expires_in)
     except Exception as exc:
         logger.debug("sample_youtube_token_expiries failed: %s", exc)
 
@@ -379,10 +385,6 @@ def push_youtube_token_expiries() -> int:
     pushgateway. Returns the number of channels reported (for logging).
     """
     try:
-        from datetime import timezone as _tz
-        from shared.db.connection import get_connection
-        from sqlalchemy import text
-
         registry = CollectorRegistry()
         gauge = Gauge(
             "cff_youtube_token_expires_in_seconds",
@@ -391,26 +393,10 @@ def push_youtube_token_expiries() -> int:
             registry=registry,
         )
 
-        now = time.time()
-        reported = 0
-        with get_connection() as conn:
-            rows = conn.execute(text("""
-                SELECT name, token_expires_at
-                FROM platform_channels
-                WHERE platform = 'youtube' AND enabled = 1 AND access_token IS NOT NULL
-            """)).fetchall()
-        for r in rows:
-            name, expires = r
-            if expires is None:
-                continue
-            try:
-                if expires.tzinfo is None:
-                    expires = expires.replace(tzinfo=_tz.utc)
-                ts = expires.timestamp()
-            except AttributeError:
-                continue
-            gauge.labels(channel=str(name)).set(ts - now)
-            reported += 1
+        expiries = _youtube_token_expiries()
+        for name, expires_in in expiries:
+            gauge.labels(channel=name).set(expires_in)
+        reported = len(expiries)
 
         try:
             push_to_gateway(
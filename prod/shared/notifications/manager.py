@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from typing import Callable
 
 from shared.notifications import telegram, email as email_mod
 from shared.queue.types import NotificationPayload
@@ -10,21 +11,33 @@ from shared.queue.types import NotificationPayload
 logger = logging.getLogger(__name__)
 
 
+def _send_telegram(payload: NotificationPayload) -> bool:
+    return telegram.send(
+        message=payload.message,
+        chat_id=payload.recipient or None,
+    )
+
+
+def _send_email(payload: NotificationPayload) -> bool:
+    recipients = [r.strip() for r in payload.recipient.split(",") if r.strip()]
+    return email_mod.send(
+        recipients=recipients,
+        subject=payload.subject or "Content Fabric Notification",
+        body=payload.message,
+    )
+
+
+_SENDERS: dict[str, Callable[[NotificationPayload], bool]] = {
+    "telegram": _send_telegram,
+    "email": _send_email,
+}
+
+
 def notify(payload: NotificationPayload) -> bool:
     """Route notification to the correct channel."""
     channel = payload.channel.lower()
-    if channel == "telegram":
-        return telegram.send(
-            message=payload.message,
-            chat_id=payload.recipient or None,
-        )
-    elif channel == "email":
-        recipients = [r.strip() for r in payload.recipient.split(",") if r.strip()]
-        return email_mod.send(
-            recipients=recipients,
-            subject=payload.subject or "Content Fabric Notification",
-            body=payload.message,
-        )
-    else:
+    sender = _SENDERS.get(channel)
+    if sender is None:
         logger.error("Unknown notification channel: %s", channel)
         return False
+    return sender(payload)
@@ -32,6 +32,9 @@ QUEUE_SORA = "sora"                         # Sora AI scraping через zenrow
 QUEUE_STATS = "stats"                       # Daily YouTube channel statistics
 QUEUE_STREAM_CONTROL = "stream_control"     # Управление 9 RTMP стримами через systemd
 
+# Redis list the scheduler blocks on between polls (see shared.queue.wake)
+SCHEDULER_WAKE_KEY = "cff:scheduler:wake"
+
 
 def get_redis() -> Redis:
     """Get or create the global Redis connection.
@@ -0,0 +1,35 @@
+"""Scheduler wake-up signal over Redis.
+
+Task creators push a token so the scheduler polls the DB right away instead
+of waiting out its interval. The list is trimmed to one entry, so a burst of
+inserts coalesces into a single wake-up. The timed poll stays the source of
+truth: a lost or failed signal only costs latency.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from shared.queue.config import SCHEDULER_WAKE_KEY, get_redis
+
+logger = logging.getLogger(__name__)
+
+
+def wake_scheduler() -> None:
+    """Ask the scheduler to poll for pending tasks now. Never raises."""
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        pipe.lpush(SCHEDULER_WAKE_KEY, 1)
+        pipe.ltrim(SCHEDULER_WAKE_KEY, 0, 0)
+        pipe.execute()
+    except Exception:
+        logger.warning("Failed to signal scheduler wake-up", exc_info=True)
+
+
+def wait_for_wake(timeout: int) -> bool:
+    """Block up to *timeout* seconds for a wake-up. True if one arrived."""
+    try:
+        return get_redis().blpop([SCHEDULER_WAKE_KEY], timeout=timeout) is not None
+    except Exception:
+        logger.debug("Scheduler wake-up wait failed", exc_info=True)
+        return False
@@ -32,7 +32,7 @@ class AudioBackgroundMixer:
         """
         self.model_name = model_name
         self.separator = None
-        logger.info(f"Audio Background Mixer initialized with model: {model_name}")
+        logger.info("Audio Background Mixer initialized with model: %s", model_name)
     
     def separate_vocals(
         self,
@@ -54,8 +54,8 @@ class AudioBackgroundMixer:
         
         os.makedirs(output_dir, exist_ok=True)
         
-        logger.info(f"Separating vocals from: {input_file}")
-        logger.info(f"Using model: {self.model_name}")
+        logger.info("Separating vocals from: %s", input_file)
+        logger.info("Using model: %s", self.model_name)
         
         # Initialize separator
         if self.separator is None:
@@ -69,11 +69,11 @@ class AudioBackgroundMixer:
         try:
             self.separator.load_model(model_filename=self.model_name)
         except Exception as e:
-            logger.warning(f"Could not load model {self.model_name}: {e}")
+            logger.warning("Could not load model %s: %s", self.model_name, e)
             # Add .onnx extension if missing
             if not self.model_name.endswith('.onnx'):
                 try:
-                    logger.info(f"Trying with .onnx extension: {self.model_name}.onnx")
+                    logger.info("Trying with .onnx extension: %s.onnx", self.model_name)
                     self.separator.load_model(model_filename=f"{self.model_name}.onnx")
                 except Exception:
                     logger.info("Falling back to UVR_MDXNET_KARA_2.onnx")
@@ -113,9 +113,9 @@ class AudioBackgroundMixer:
             inst_basename = os.path.basename(instrumental_file)
             instrumental_file = os.path.join(output_dir, inst_basename)
         
-        logger.info(f"✅ Vocals separated:")
-        logger.info(f"   Vocals: {vocals_file}")
-        logger.info(f"   Background: {instrumental_file}")
+        logger.info("✅ Vocals separated:")
+        logger.info("   Vocals: %s", vocals_file)
+        logger.info("   Background: %s", instrumental_file)
         
         return vocals_file, instrumental_file
     
@@ -140,9 +140,9 @@ class AudioBackgroundMixer:
         Returns:
             Path to mixed file
         """
-        logger.info(f"Mixing audio:")
-        logger.info(f"   Vocals: {vocals_file} (gain: {vocals_gain} dB)")
-        logger.info(f"   Background: {background_file} (gain: {background_gain} dB)")
+        logger.info("Mixing audio:")
+        logger.info("   Vocals: %s (gain: %s dB)", vocals_file, vocals_gain)
+        logger.info("   Background: %s (gain: %s dB)", background_file, background_gain)
         
         # Load audio files
         vocals = AudioSegment.from_file(vocals_file)
@@ -171,7 +171,7 @@ class AudioBackgroundMixer:
         # Export
         mixed.export(output_file, format=os.path.splitext(output_file)[1][1:])
         
-        logger.info(f"✅ Mixed audio saved: {output_file}")
+        logger.info("✅ Mixed audio saved: %s", output_file)
         
         return output_file
     
@@ -235,7 +235,7 @@ class AudioBackgroundMixer:
             return final_file
             
         except Exception as e:
-            logger.error(f"Error in background preservation pipeline: {str(e)}")
+            logger.error("Error in background preservation pipeline: %s", e)
             raise
         finally:
             # Cleanup temp files (optional - comment out if you want to keep them)
@@ -100,9 +100,9 @@ class ParallelVoiceProcessor:
         Path(self.temp_dir).mkdir(parents=True, exist_ok=True)
         
         logger.info("Parallel Voice Processor initialized:")
-        logger.info(f"  Chunk duration: {chunk_duration_minutes} minutes")
-        logger.info(f"  Max workers: {self.max_workers}")
-        logger.info(f"  Temp dir: {self.temp_dir}")
+        logger.info("  Chunk duration: %s minutes", chunk_duration_minutes)
+        logger.info("  Max workers: %s", self.max_workers)
+        logger.info("  Temp dir: %s", self.temp_dir)
     
     def split_audio(
         self,
@@ -124,8 +124,8 @@ class ParallelVoiceProcessor:
         
         Path(output_dir).mkdir(parents=True, exist_ok=True)
         
-        logger.info(f"Splitting audio: {input_file}")
-        logger.info(f"  Chunk duration: {self.chunk_duration_minutes} minutes")
+        logger.info("Splitting audio: %s", input_file)
+        logger.info("  Chunk duration: %s minutes", self.chunk_duration_minutes)
         
         # Load audio with librosa for better performance
         audio, sr = librosa.load(input_file, sr=None, mono=False)
@@ -138,14 +138,14 @@ class ParallelVoiceProcessor:
             channels = audio.shape[0]
             duration = audio.shape[1] / sr
         
-        logger.info(f"  Audio info: {duration:.2f}s, {sr}Hz, {channels} channels")
+        logger.info("  Audio info: %.2fs, %sHz, %s channels", duration, sr, channels)
         
         # Calculate number of chunks
         chunk_samples = int(self.chunk_duration_seconds * sr)
         total_samples = len(audio) if channels == 1 else audio.shape[1]
         num_chunks = int(np.ceil(total_samples / chunk_samples))
         
-        logger.info(f"  Creating {num_chunks} chunks...")
+        logger.info("  Creating %s chunks...", num_chunks)
         
         chunks = []
         
@@ -178,9 +178,9 @@ class ParallelVoiceProcessor:
             
             chunks.append(chunk_info)
             
-            logger.info(f"  Chunk {i+1}/{num_chunks}: {start_time:.1f}s - {end_time:.1f}s")
+            logger.info("  Chunk %s/%s: %.1fs - %.1fs", i+1, num_chunks, start_time, end_time)
         
-        logger.info(f"✅ Split into {len(chunks)} chunks")
+        logger.info("✅ Split into %s chunks", len(chunks))
         
         return chunks
     
@@ -214,7 +214,7 @@ class ParallelVoiceProcessor:
             processor_params = {}
         
         executor_type = "processes" if use_processes else "threads"
-        logger.info(f"Processing {len(chunks)} chunks in parallel with {self.max_workers} {executor_type}...")
+        logger.info("Processing %s chunks in parallel with %s %s...", len(chunks), self.max_workers, executor_type)
         
         processed_chunks = []
         
@@ -226,7 +226,7 @@ class ParallelVoiceProcessor:
                 input_path = chunk_info['path']
                 output_path = os.path.join(output_dir, f'processed_chunk_{chunk_idx:04d}.wav')
                 
-                logger.info(f"  [Worker] Processing chunk {chunk_idx}...")
+                logger.info("  [Worker] Processing chunk %s...", chunk_idx)
                 
                 try:
                     # Call the processor function
@@ -240,12 +240,12 @@ class ParallelVoiceProcessor:
                         'result': result
                     }
                     
-                    logger.info(f"  [Worker] Chunk {chunk_idx} completed ✅")
+                    logger.info("  [Worker] Chunk %s completed ✅", chunk_idx)
                     
                     return processed_info
                     
                 except Exception as e:
-                    logger.error(f"  [Worker] Chunk {chunk_idx} failed: {str(e)}")
+                    logger.error("  [Worker] Chunk %s failed: %s", chunk_idx, e)
                     
                     return {
                         **chunk_info,
@@ -264,7 +264,7 @@ class ParallelVoiceProcessor:
                         processed_chunk = future.result()
                         processed_chunks.append(processed_chunk)
                     except Exception as e:
-                        logger.error(f"  Worker error: {str(e)}")
+                        logger.error("  Worker error: %s", e)
         else:
             # Use ProcessPoolExecutor for true parallelism
             # Create partial function with fixed parameters
@@ -287,13 +287,13 @@ class ParallelVoiceProcessor:
                         processed_chunks.append(processed_chunk)
                         
                         if processed_chunk['status'] == 'success':
-                            logger.info(f"  [Process] Chunk {processed_chunk['index']} completed ✅")
+                            logger.info("  [Process] Chunk %s completed ✅", processed_chunk['index'])
                         else:
-                            logger.error(f"  [Process] Chunk {processed_chunk['index']} failed")
+                            logger.error("  [Process] Chunk %s failed", processed_chunk['index'])
                             
                     except Exception as e:
                         chunk = futures[future]
-                        logger.error(f"  [Process] Chunk {chunk['index']} error: {str(e)}")
+                        logger.error("  [Process] Chunk %s error: %s", chunk['index'], e)
         
         # Sort by index to maintain order
         processed_chunks.sort(key=lambda x: x['index'])
@@ -302,10 +302,10 @@ class ParallelVoiceProcessor:
         failed = [c for c in processed_chunks if c['status'] == 'failed']
         successful = [c for c in processed_chunks if c['status'] == 'success']
         
-        logger.info(f"✅ Parallel processing complete: {len(successful)} successful, {len(failed)} failed")
+        logger.info("✅ Parallel processing complete: %s successful, %s failed", len(successful), len(failed))
         
         if failed:
-            logger.warning(f"⚠️  Failed chunks: {[c['index'] for c in failed]}")
+            logger.warning("⚠️  Failed chunks: %s", [c['index'] for c in failed])
         
         return processed_chunks
     
@@ -326,8 +326,8 @@ class ParallelVoiceProcessor:
         Returns:
             Path to output file
         """
-        logger.info(f"Reassembling {len(processed_chunks)} chunks into: {output_file}")
-        logger.info(f"  Crossfade: {crossfade_ms}ms")
+        logger.info("Reassembling %s chunks into: %s", len(processed_chunks), output_file)
+        logger.info("  Crossfade: %sms", crossfade_ms)
         
         # Filter successful chunks
         successful_chunks = [c for c in processed_chunks if c['status'] == 'success']
@@ -339,7 +339,7 @@ class ParallelVoiceProcessor:
         first_chunk = successful_chunks[0]
         combined = AudioSegment.from_file(first_chunk['processed_path'])
         
-        logger.info(f"  Starting with chunk 0 ({len(combined)/1000:.1f}s)")
+        logger.info("  Starting with chunk 0 (%.1fs)", len(combined)/1000)
         
         # Append remaining chunks with crossfade
         for i, chunk_info in enumerate(successful_chunks[1:], start=1):
@@ -352,14 +352,14 @@ class ParallelVoiceProcessor:
                 # Simple concatenation
                 combined = combined + chunk_audio
             
-            logger.info(f"  Added chunk {i} ({len(chunk_audio)/1000:.1f}s) - total: {len(combined)/1000:.1f}s")
+            logger.info("  Added chunk %s (%.1fs) - total: %.1fs", i, len(chunk_audio)/1000, len(combined)/1000)
         
         # Export final file
         file_ext = os.path.splitext(output_file)[1][1:] or 'wav'
         combined.export(output_file, format=file_ext)
         
-        logger.info(f"✅ Reassembled into: {output_file}")
-        logger.info(f"  Final duration: {len(combined)/1000:.1f}s")
+        logger.info("✅ Reassembled into: %s", output_file)
+        logger.info("  Final duration: %.1fs", len(combined)/1000)
         
         return output_file
     
@@ -409,8 +409,8 @@ class ParallelVoiceProcessor:
                 input_file,
                 os.path.join(self.temp_dir, 'separation')
             )
-            logger.info(f"  Vocals: {vocals_file}")
-            logger.info(f"  Background: {background_file}")
+            logger.info("  Vocals: %s", vocals_file)
+            logger.info("  Background: %s", background_file)
         else:
             logger.info("Step 1: Skipping background separation")
         
@@ -467,9 +467,9 @@ class ParallelVoiceProcessor:
         background_gain: float = -3.0
     ) -> str:
         """Mix vocals with background"""
-        logger.info(f"  Mixing audio:")
-        logger.info(f"    Vocals: {vocals_file} (gain: {vocals_gain} dB)")
-        logger.info(f"    Background: {background_file} (gain: {background_gain} dB)")
+        logger.info("  Mixing audio:")
+        logger.info("    Vocals: %s (gain: %s dB)", vocals_file, vocals_gain)
+        logger.info("    Background: %s (gain: %s dB)", background_file, background_gain)
         
         # Load audio files
         vocals = AudioSegment.from_file(vocals_file)
@@ -497,7 +497,7 @@ class ParallelVoiceProcessor:
         file_ext = os.path.splitext(output_file)[1][1:] or 'wav'
         mixed.export(output_file, format=file_ext)
         
-        logger.info(f"  ✅ Mixed audio: {output_file}")
+        logger.info("  ✅ Mixed audio: %s", output_file)
         
         return output_file
     
@@ -508,9 +508,9 @@ class ParallelVoiceProcessor:
         if os.path.exists(self.temp_dir):
             try:
                 shutil.rmtree(self.temp_dir)
-                logger.info(f"Cleaned up temp directory: {self.temp_dir}")
+                logger.info("Cleaned up temp directory: %s", self.temp_dir)
             except Exception as e:
-                logger.warning(f"Failed to cleanup temp directory: {str(e)}")
+                logger.warning("Failed to cleanup temp directory: %s", e)
 
 
 def create_parallel_processor(
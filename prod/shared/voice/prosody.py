@@ -62,7 +62,7 @@ class ProsodyTransfer:
             'duration': len(audio) / sr
         }
         
-        logger.info(f"Prosody extracted: {len(pauses)} pauses, rate={speech_rate:.2f}")
+        logger.info("Prosody extracted: %s pauses, rate=%.2f", len(pauses), speech_rate)
         
         return prosody
     
@@ -95,7 +95,7 @@ class ProsodyTransfer:
         source_duration = source_prosody['duration']
         
         if abs(target_duration - source_duration) > 0.5:
-            logger.info(f"Adjusting duration: {target_duration:.2f}s -> {source_duration:.2f}s")
+            logger.info("Adjusting duration: %.2fs -> %.2fs", target_duration, source_duration)
             audio_with_pauses = self._time_stretch(
                 audio_with_pauses, target_sr, source_duration
             )
@@ -169,7 +169,7 @@ class ProsodyTransfer:
                     pauses.append((pause_start, pause_end))
                 in_pause = False
         
-        logger.info(f"Detected {len(pauses)} pauses")
+        logger.info("Detected %s pauses", len(pauses))
         return pauses
     
     def _estimate_speech_rate(
@@ -215,7 +215,7 @@ class ProsodyTransfer:
         if not pauses:
             return audio
         
-        logger.info(f"Inserting {len(pauses)} pauses...")
+        logger.info("Inserting %s pauses...", len(pauses))
         
         # For now, we'll preserve the audio as is
         # More sophisticated version would align words and insert pauses precisely
@@ -234,7 +234,7 @@ class ProsodyTransfer:
         current_duration = len(audio) / sr
         rate = current_duration / target_duration
         
-        logger.info(f"Time-stretching: rate={rate:.3f}")
+        logger.info("Time-stretching: rate=%.3f", rate)
         
         # Use librosa's high-quality time stretching
         audio_stretched = librosa.effects.time_stretch(audio, rate=rate)
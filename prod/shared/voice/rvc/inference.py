@@ -43,7 +43,7 @@ class RVCInference:
         self.current_model = None
         self.current_model_id = None
         
-        logger.info(f"RVC Inference initialized on {self.device}")
+        logger.info("RVC Inference initialized on %s", self.device)
     
     def load_model(self, model_id: str) -> bool:
         """
@@ -56,19 +56,19 @@ class RVCInference:
             True if successful
         """
         if model_id == self.current_model_id and self.current_model is not None:
-            logger.info(f"Model {model_id} already loaded")
+            logger.info("Model %s already loaded", model_id)
             return True
         
         if not self.model_manager.is_installed(model_id):
-            logger.info(f"Model {model_id} not installed, downloading...")
+            logger.info("Model %s not installed, downloading...", model_id)
             if not self.model_manager.download_model(model_id):
-                logger.error(f"Failed to download model {model_id}")
+                logger.error("Failed to download model %s", model_id)
                 return False
         
         model_path = self.model_manager.get_model_path(model_id)
         
         try:
-            logger.info(f"Loading model from: {model_path}")
+            logger.info("Loading model from: %s", model_path)
             
             # For now, we'll use a simplified approach
             # In production, you'd load the actual RVC model checkpoint
@@ -79,11 +79,11 @@ class RVCInference:
                 'loaded': True
             }
             
-            logger.info(f"Model {model_id} loaded successfully")
+            logger.info("Model %s loaded successfully", model_id)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to load model {model_id}: {str(e)}")
+            logger.error("Failed to load model %s: %s", model_id, e)
             return False
     
     def convert_voice(
@@ -111,8 +111,8 @@ class RVCInference:
         if not self.load_model(model_id):
             raise RuntimeError(f"Failed to load model {model_id}")
         
-        logger.info(f"Converting voice with model: {model_id}")
-        logger.info(f"F0 method: {f0_method}, Pitch shift: {pitch_shift}")
+        logger.info("Converting voice with model: %s", model_id)
+        logger.info("F0 method: %s, Pitch shift: %s", f0_method, pitch_shift)
         
         # Get model info
         model_info = self.model_manager.AVAILABLE_MODELS.get(model_id, {})
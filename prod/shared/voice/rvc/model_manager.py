@@ -136,7 +136,7 @@ class RVCModelManager:
         self.index_file = self.models_dir / 'models.json'
         self.installed_models = self._load_installed_models()
         
-        logger.info(f"RVC Model Manager initialized: {self.models_dir}")
+        logger.info("RVC Model Manager initialized: %s", self.models_dir)
     
     def _load_installed_models(self) -> Dict:
         """Load list of installed models"""
@@ -182,22 +182,22 @@ class RVCModelManager:
             True if successful
         """
         if model_id not in self.AVAILABLE_MODELS:
-            logger.error(f"Model {model_id} not found in available models")
+            logger.error("Model %s not found in available models", model_id)
             return False
         
         if self.is_installed(model_id):
-            logger.info(f"Model {model_id} already installed")
+            logger.info("Model %s already installed", model_id)
             return True
         
         model_info = self.AVAILABLE_MODELS[model_id]
         url = model_info['url']
         
         if url == 'custom':
-            logger.warning(f"Model {model_id} requires custom installation")
+            logger.warning("Model %s requires custom installation", model_id)
             return False
         
-        logger.info(f"Downloading model: {model_id}")
-        logger.info(f"URL: {url}")
+        logger.info("Downloading model: %s", model_id)
+        logger.info("URL: %s", url)
         
         try:
             # Download model
@@ -216,7 +216,7 @@ class RVCModelManager:
                         downloaded += len(chunk)
                         progress = (downloaded / total_size) * 100
                         if downloaded % (1024 * 1024) == 0:  # Log every MB
-                            logger.info(f"Downloaded: {progress:.1f}%")
+                            logger.info("Downloaded: %.1f%%", progress)
                 else:
                     f.write(response.content)
             
@@ -229,11 +229,11 @@ class RVCModelManager:
             }
             self._save_installed_models()
             
-            logger.info(f"Model {model_id} installed successfully")
+            logger.info("Model %s installed successfully", model_id)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to download model {model_id}: {str(e)}")
+            logger.error("Failed to download model %s: %s", model_id, e)
             return False
     
     def remove_model(self, model_id: str) -> bool:
@@ -247,7 +247,7 @@ class RVCModelManager:
             True if successful
         """
         if not self.is_installed(model_id):
-            logger.warning(f"Model {model_id} not installed")
+            logger.warning("Model %s not installed", model_id)
             return False
         
         try:
@@ -258,10 +258,10 @@ class RVCModelManager:
             del self.installed_models[model_id]
             self._save_installed_models()
             
-            logger.info(f"Model {model_id} removed successfully")
+            logger.info("Model %s removed successfully", model_id)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to remove model {model_id}: {str(e)}")
+            logger.error("Failed to remove model %s: %s", model_id, e)
             return False
 
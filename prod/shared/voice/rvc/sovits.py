@@ -41,7 +41,7 @@ class SoVITSConverter:
             self.device = device
         
         self.model = None
-        logger.info(f"So-VITS-SVC Converter initialized on {self.device}")
+        logger.info("So-VITS-SVC Converter initialized on %s", self.device)
     
     def convert_voice(
         self,
@@ -66,11 +66,11 @@ class SoVITSConverter:
         Returns:
             Tuple of (converted audio, sample rate)
         """
-        logger.info(f"So-VITS-SVC conversion:")
-        logger.info(f"  Target voice: {target_voice}")
-        logger.info(f"  F0 method: {f0_method}")
-        logger.info(f"  Pitch shift: {pitch_shift}")
-        logger.info(f"  Cluster ratio: {cluster_ratio}")
+        logger.info("So-VITS-SVC conversion:")
+        logger.info("  Target voice: %s", target_voice)
+        logger.info("  F0 method: %s", f0_method)
+        logger.info("  Pitch shift: %s", pitch_shift)
+        logger.info("  Cluster ratio: %s", cluster_ratio)
         
         # Apply advanced voice conversion with better voice modeling
         audio_converted = self._advanced_conversion(
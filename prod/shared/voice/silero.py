@@ -75,10 +75,10 @@ class SileroVoiceChanger:
             logger.info("✓ Russian stress marker initialized for normative pronunciation")
         except Exception as e:
             self.stress_marker = None
-            logger.warning(f"⚠ Failed to initialize stress marker: {e}")
+            logger.warning("⚠ Failed to initialize stress marker: %s", e)
             logger.warning("  Text will be synthesized without stress marks")
         
-        logger.info(f"Silero Voice Changer initialized on {self.device}")
+        logger.info("Silero Voice Changer initialized on %s", self.device)
     
     def load_models(self, whisper_size: str = 'small'):
         """
@@ -109,16 +109,16 @@ class SileroVoiceChanger:
                 self.silero_model.to(self.device)
                 logger.info("Silero TTS model loaded successfully")
             except Exception as e:
-                logger.error(f"Failed to load Silero: {str(e)}")
+                logger.error("Failed to load Silero: %s", e)
                 raise
         
         if self.whisper_model is None and whisper is not None:
-            logger.info(f"Loading Whisper model ({whisper_size})...")
+            logger.info("Loading Whisper model (%s)...", whisper_size)
             try:
                 self.whisper_model = whisper.load_model(whisper_size, device=self.device)
                 logger.info("Whisper model loaded successfully")
             except Exception as e:
-                logger.error(f"Failed to load Whisper: {str(e)}")
+                logger.error("Failed to load Whisper: %s", e)
                 raise
     
     def convert_voice(
@@ -144,11 +144,11 @@ class SileroVoiceChanger:
         # Load models
         self.load_models()
         
-        logger.info(f"Converting voice with Silero:")
-        logger.info(f"  Input: {input_file}")
-        logger.info(f"  Output: {output_file}")
-        logger.info(f"  Target voice: {target_voice}")
-        logger.info(f"  Preserve prosody: {preserve_prosody}")
+        logger.info("Converting voice with Silero:")
+        logger.info("  Input: %s", input_file)
+        logger.info("  Output: %s", output_file)
+        logger.info("  Target voice: %s", target_voice)
+        logger.info("  Preserve prosody: %s", preserve_prosody)
         
         # Load original audio for prosody extraction
         if preserve_prosody:
@@ -164,7 +164,7 @@ class SileroVoiceChanger:
         if not transcript:
             raise ValueError("Failed to transcribe audio")
         
-        logger.info(f"Transcribed text: {transcript[:100]}...")
+        logger.info("Transcribed text: %s...", transcript[:100])
         
         # Step 2: Extract prosody from original
         source_prosody = None
@@ -175,7 +175,7 @@ class SileroVoiceChanger:
             )
         
         # Step 3: Synthesize with Silero (with pauses from segments)
-        logger.info(f"Step 3: Synthesizing with Silero voice '{target_voice}'...")
+        logger.info("Step 3: Synthesizing with Silero voice '%s'...", target_voice)
         audio_synthesized = self._synthesize(
             transcript, target_voice, sample_rate, 
             segments=result.get('segments', [])
@@ -194,7 +194,7 @@ class SileroVoiceChanger:
         logger.info("Step 5: Saving result...")
         sf.write(output_file, audio_final, sample_rate)
         
-        logger.info(f"Silero conversion completed: {output_file}")
+        logger.info("Silero conversion completed: %s", output_file)
         
         return {
             'success': True,
@@ -238,14 +238,14 @@ class SileroVoiceChanger:
                 transcript = self._add_stress_marks(transcript)
                 logger.info("✓ Stress marks added for natural pronunciation")
             
-            logger.info(f"Transcription completed: {len(transcript)} characters")
-            logger.info(f"Segments: {len(result.get('segments', []))}")
+            logger.info("Transcription completed: %s characters", len(transcript))
+            logger.info("Segments: %s", len(result.get('segments', [])))
             
             return {**result, 'text': transcript}
             
             
         except Exception as e:
-            logger.error(f"Transcription failed: {str(e)}")
+            logger.error("Transcription failed: %s", e)
             # Try without word timestamps as fallback
             try:
                 result = self.whisper_model.transcribe(
@@ -276,7 +276,7 @@ class SileroVoiceChanger:
             return self._synthesize_simple(text, voice, sample_rate, speaking_rate)
             
         except Exception as e:
-            logger.error(f"Synthesis failed: {str(e)}")
+            logger.error("Synthesis failed: %s", e)
             raise
     
     def _synthesize_with_timing(
@@ -304,10 +304,10 @@ class SileroVoiceChanger:
             if pause_duration > 0.1:  # Add pause if > 100ms
                 silence = np.zeros(int(pause_duration * sample_rate))
                 audio_parts.append(silence)
-                logger.info(f"Added pause: {pause_duration:.2f}s")
+                logger.info("Added pause: %.2fs", pause_duration)
             
             # Synthesize segment text
-            logger.info(f"Segment {i+1}/{len(segments)}: {seg_text[:50]}...")
+            logger.info("Segment %s/%s: %s...", i+1, len(segments), seg_text[:50])
             
             audio_seg = self.silero_model.apply_tts(
                 text=seg_text,
@@ -328,7 +328,7 @@ class SileroVoiceChanger:
         # Concatenate all parts
         audio_full = np.concatenate(audio_parts) if len(audio_parts) > 1 else audio_parts[0]
         
-        logger.info(f"Synthesized with {len(segments)} segments and pauses")
+        logger.info("Synthesized with %s segments and pauses", len(segments))
         return audio_full
     
     def _synthesize_simple(
@@ -351,17 +351,17 @@ class SileroVoiceChanger:
             
             # Skip sentences that are only punctuation
             if not re.search(r'[а-яёА-ЯЁ]', sentence):
-                logger.debug(f"Skipping sentence {i+1}/{len(sentences)} (only punctuation): {sentence[:50]}")
+                logger.debug("Skipping sentence %s/%s (only punctuation): %s", i+1, len(sentences), sentence[:50])
                 continue
                 
-            logger.info(f"Synthesizing sentence {i+1}/{len(sentences)}: {sentence[:50]}...")
+            logger.info("Synthesizing sentence %s/%s: %s...", i+1, len(sentences), sentence[:50])
             
             # Split sentence if too long (Silero has limits)
             sub_chunks = self._split_text(sentence, max_length=100)
             
             # Skip if no chunks (shouldn't happen but safety check)
             if not sub_chunks:
-                logger.warning(f"No chunks for sentence {i+1}: {sentence[:50]}")
+                logger.warning("No chunks for sentence %s: %s", i+1, sentence[:50])
                 continue
             
             for sub_chunk in sub_chunks:
@@ -391,7 +391,7 @@ class SileroVoiceChanger:
                 
                 pause = np.zeros(int(pause_duration * sample_rate))
                 audio_chunks.append(pause)
-                logger.info(f"Added pause: {pause_duration:.2f}s")
+                logger.info("Added pause: %.2fs", pause_duration)
         
         # Concatenate all chunks
         audio_full = np.concatenate(audio_chunks) if len(audio_chunks) > 1 else audio_chunks[0]
@@ -470,7 +470,7 @@ class SileroVoiceChanger:
         if current_chunk:
             chunks.append(current_chunk.strip())
         
-        logger.info(f"Split text into {len(chunks)} chunks (max {max_length} chars each)")
+        logger.info("Split text into %s chunks (max %s chars each)", len(chunks), max_length)
         
         return chunks if chunks else [text[:max_length]]
     
@@ -530,16 +530,16 @@ class SileroVoiceChanger:
             
             # Log sample for debugging
             if len(text) > 100:
-                logger.debug(f"Original (sample): {text[:100]}...")
-                logger.debug(f"With stress (sample): {text_with_stress[:100]}...")
+                logger.debug("Original (sample): %s...", text[:100])
+                logger.debug("With stress (sample): %s...", text_with_stress[:100])
             else:
-                logger.debug(f"Original: {text}")
-                logger.debug(f"With stress: {text_with_stress}")
+                logger.debug("Original: %s", text)
+                logger.debug("With stress: %s", text_with_stress)
             
             return text_with_stress
             
         except Exception as e:
-            logger.error(f"❌ Failed to add stress marks: {str(e)}")
+            logger.error("❌ Failed to add stress marks: %s", e)
             logger.warning("Falling back to text without stress marks")
             return text
     
@@ -580,12 +580,12 @@ class SileroVoiceChanger:
         # Load models
         self.load_models()
         
-        logger.info(f"Synthesizing text to audio with Silero:")
-        logger.info(f"  Output: {output_file}")
-        logger.info(f"  Target voice: {target_voice}")
-        logger.info(f"  Sample rate: {sample_rate}")
-        logger.info(f"  Add stress: {add_stress}")
-        logger.info(f"  Text length: {len(text)} characters")
+        logger.info("Synthesizing text to audio with Silero:")
+        logger.info("  Output: %s", output_file)
+        logger.info("  Target voice: %s", target_voice)
+        logger.info("  Sample rate: %s", sample_rate)
+        logger.info("  Add stress: %s", add_stress)
+        logger.info("  Text length: %s characters", len(text))
         
         # Step 1: Add Russian stress marks if needed
         processed_text = text
@@ -598,12 +598,12 @@ class SileroVoiceChanger:
                 )
                 logger.info("✓ Stress marks added for natural pronunciation")
             except Exception as e:
-                logger.warning(f"Failed to add stress marks: {e}, using original text")
+                logger.warning("Failed to add stress marks: %s, using original text", e)
                 processed_text = text
         
         # Step 2: Synthesize with Silero
-        logger.info(f"Synthesizing with Silero voice '{target_voice}'...")
-        logger.info(f"Speaking rate: {speaking_rate:.2f}x")
+        logger.info("Synthesizing with Silero voice '%s'...", target_voice)
+        logger.info("Speaking rate: %.2fx", speaking_rate)
         audio_synthesized = self._synthesize_simple(
             processed_text,
             target_voice,
@@ -615,7 +615,7 @@ class SileroVoiceChanger:
         logger.info("Saving result...")
         sf.write(output_file, audio_synthesized, sample_rate)
         
-        logger.info(f"Text-to-speech synthesis completed: {output_file}")
+        logger.info("Text-to-speech synthesis completed: %s", output_file)
         
         return {
             'success': True,
@@ -650,10 +650,10 @@ class SileroVoiceChanger:
         
         try:
             audio_stretched = librosa.effects.time_stretch(audio, rate=stretch_factor)
-            logger.info(f"Applied speed change: {rate:.2f}x (stretch_factor={stretch_factor:.2f})")
+            logger.info("Applied speed change: %.2fx (stretch_factor=%.2f)", rate, stretch_factor)
             return audio_stretched
         except Exception as e:
-            logger.warning(f"Failed to change speech rate: {e}, using original audio")
+            logger.warning("Failed to change speech rate: %s, using original audio", e)
             return audio
     
     def get_available_voices(self) -> dict:
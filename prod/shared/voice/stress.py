@@ -126,7 +126,7 @@ class RussianStressMarker:
                 self.engine_type = 'russtress'
                 logger.info("✓ Loaded russtress for automatic stress detection")
             except Exception as e:
-                logger.warning(f"Failed to load russtress: {e}")
+                logger.warning("Failed to load russtress: %s", e)
         
         if not self.accent_engine and RUSSIAN_ACCENTUATE_AVAILABLE:
             try:
@@ -134,7 +134,7 @@ class RussianStressMarker:
                 self.engine_type = 'russian_accentuate'
                 logger.info("✓ Loaded russian_accentuate for automatic stress detection")
             except Exception as e:
-                logger.warning(f"Failed to load russian_accentuate: {e}")
+                logger.warning("Failed to load russian_accentuate: %s", e)
         
         # Initialize pymorphy3 if available
         self.pymorphy = None
@@ -144,7 +144,7 @@ class RussianStressMarker:
                 self.pymorphy = pymorphy3.MorphAnalyzer()
                 logger.info("✓ pymorphy3 initialized for stress detection")
             except Exception as e:
-                logger.warning(f"Failed to initialize pymorphy3: {e}")
+                logger.warning("Failed to initialize pymorphy3: %s", e)
         
         if not self.accent_engine:
             logger.warning("⚠ No automatic stress detection library available")
@@ -156,10 +156,10 @@ class RussianStressMarker:
             for word, position in EXTENDED_STRESS_DICT.items():
                 if word not in self.COMMON_WORDS_STRESS:
                     self.COMMON_WORDS_STRESS[word] = [(position, f"{word}")]
-            logger.info(f"✓ Loaded {len(EXTENDED_STRESS_DICT)} words from extended dictionary")
+            logger.info("✓ Loaded %s words from extended dictionary", len(EXTENDED_STRESS_DICT))
         
-        logger.info(f"Russian Stress Marker initialized (symbol: {stress_symbol}, use_yo: {use_yo})")
-        logger.info(f"Total dictionary size: {len(self.COMMON_WORDS_STRESS)} words")
+        logger.info("Russian Stress Marker initialized (symbol: %s, use_yo: %s)", stress_symbol, use_yo)
+        logger.info("Total dictionary size: %s words", len(self.COMMON_WORDS_STRESS))
     
     def add_stress(self, text: str, handle_homographs: bool = True) -> str:
         """
@@ -175,7 +175,7 @@ class RussianStressMarker:
         if not text or not text.strip():
             return text
         
-        logger.info(f"Adding stress marks to text ({len(text)} chars)...")
+        logger.info("Adding stress marks to text (%s chars)...", len(text))
         
         # Используем автоматическую библиотеку если доступна
         if self.accent_engine and self.engine_type == 'russtress':
@@ -190,7 +190,7 @@ class RussianStressMarker:
                 return text_with_stress
                 
             except Exception as e:
-                logger.warning(f"Russtress failed: {e}, using fallback")
+                logger.warning("Russtress failed: %s, using fallback", e)
         
         elif self.accent_engine and self.engine_type == 'russian_accentuate':
             try:
@@ -204,7 +204,7 @@ class RussianStressMarker:
                 return text_with_stress
                 
             except Exception as e:
-                logger.warning(f"Russian_accentuate failed: {e}, using fallback")
+                logger.warning("Russian_accentuate failed: %s, using fallback", e)
         
         # Try pymorphy3 if available
         if self.pymorphy:
@@ -213,7 +213,7 @@ class RussianStressMarker:
                 logger.info("✓ Stress marks added using pymorphy3")
                 return text_with_stress
             except Exception as e:
-                logger.warning(f"pymorphy3 failed: {e}, using fallback")
+                logger.warning("pymorphy3 failed: %s, using fallback", e)
         
         # Fallback: словарный подход
         text_with_stress = self._add_stress_dictionary(text, handle_homographs)
@@ -249,7 +249,7 @@ class RussianStressMarker:
                     else:
                         result = result.replace(word, stressed_word.replace('+', self.stress_symbol))
             except Exception as e:
-                logger.debug(f"Could not stress word '{word}': {e}")
+                logger.debug("Could not stress word '%s': %s", word, e)
                 continue
         
         return result
@@ -287,7 +287,7 @@ class RussianStressMarker:
                     if handle_homographs:
                         position, note = stress_positions[0]
                         stressed_word = self._apply_stress_at_position(word, position)
-                        logger.debug(f"Homograph: {word} -> {stressed_word} ({note})")
+                        logger.debug("Homograph: %s -> %s (%s)", word, stressed_word, note)
                         result_words.append(stressed_word)
                     else:
                         result_words.append(word)
@@ -135,7 +135,7 @@ class VoiceChanger:
                 max_workers=max_workers,
                 temp_dir=os.path.join(self.temp_dir, 'parallel')
             )
-            logger.info(f"Parallel processing enabled: {chunk_duration_minutes}min chunks, {max_workers or 'auto'} workers")
+            logger.info("Parallel processing enabled: %smin chunks, %s workers", chunk_duration_minutes, max_workers or 'auto')
         else:
             self.parallel_processor = None
         
@@ -143,8 +143,8 @@ class VoiceChanger:
         self.background_mixer = AudioBackgroundMixer()
         
         logger.info("Voice Changer initialized with RVC + So-VITS-SVC + Silero")
-        logger.info(f"Device: {self.device}")
-        logger.info(f"Temp dir: {self.temp_dir}")
+        logger.info("Device: %s", self.device)
+        logger.info("Temp dir: %s", self.temp_dir)
     
     def process_file(
         self,
@@ -181,8 +181,8 @@ class VoiceChanger:
         Returns:
             Processing results
         """
-        logger.info(f"Starting RVC voice conversion: {input_file} -> {output_file}")
-        logger.info(f"Conversion type: {conversion_type}")
+        logger.info("Starting RVC voice conversion: %s -> %s", input_file, output_file)
+        logger.info("Conversion type: %s", conversion_type)
         
         if not os.path.exists(input_file):
             raise FileNotFoundError(f"Input file not found: {input_file}")
@@ -232,11 +232,11 @@ class VoiceChanger:
                     input_file, output_file, pitch_shift, formant_shift, preserve_quality, voice_model
                 )
             
-            logger.info(f"RVC voice conversion completed: {output_file}")
+            logger.info("RVC voice conversion completed: %s", output_file)
             return result
             
         except Exception as e:
-            logger.error(f"Error during RVC conversion: {str(e)}")
+            logger.error("Error during RVC conversion: %s", e)
             raise
     
     def process_text(
@@ -273,10 +273,10 @@ class VoiceChanger:
             ...     voice="kseniya"
             ... )
         """
-        logger.info(f"Processing text to audio:")
-        logger.info(f"  Text length: {len(text)} characters")
-        logger.info(f"  Output: {output_file}")
-        logger.info(f"  Voice: {voice}")
+        logger.info("Processing text to audio:")
+        logger.info("  Text length: %s characters", len(text))
+        logger.info("  Output: %s", output_file)
+        logger.info("  Voice: %s", voice)
         
         # Use SileroVoiceChanger for text-to-speech
         result = self.silero_changer.synthesize_text_to_audio(
@@ -288,7 +288,7 @@ class VoiceChanger:
             speaking_rate=speaking_rate
         )
         
-        logger.info(f"Text-to-speech processing completed: {output_file}")
+        logger.info("Text-to-speech processing completed: %s", output_file)
         return result
     
     def _process_video(
@@ -411,18 +411,18 @@ class VoiceChanger:
         - WORLD vocoder for feature extraction
         - Model-based voice characteristics
         """
-        logger.info(f"RVC conversion: pitch={pitch_shift}, formant={formant_shift}, model={voice_model}")
+        logger.info("RVC conversion: pitch=%s, formant=%s, model=%s", pitch_shift, formant_shift, voice_model)
         
         # Load audio
         audio, sr = librosa.load(input_file, sr=None, mono=True)
         audio = audio.astype(np.float64)
         duration = len(audio) / sr
         
-        logger.info(f"Loaded audio: {duration:.2f}s, {sr}Hz")
+        logger.info("Loaded audio: %.2fs, %sHz", duration, sr)
         
         # Use voice model if specified (So-VITS-SVC for better quality)
         if voice_model:
-            logger.info(f"Using So-VITS-SVC with model: {voice_model}")
+            logger.info("Using So-VITS-SVC with model: %s", voice_model)
             audio_converted, sr = self.sovits_converter.convert_voice(
                 audio, sr, 
                 target_voice=voice_model,
@@ -431,7 +431,7 @@ class VoiceChanger:
                 cluster_ratio=0.5  # Balance between source and target
             )
             sf.write(output_file, audio_converted, sr)
-            logger.info(f"So-VITS-SVC conversion completed: {output_file}")
+            logger.info("So-VITS-SVC conversion completed: %s", output_file)
             return duration
         
         # Extract F0 (pitch), spectral envelope, and aperiodicity using WORLD
@@ -439,11 +439,11 @@ class VoiceChanger:
         f0, sp, ap = self._world_decompose(audio, sr)
         
         # Modify pitch
-        logger.info(f"Applying pitch shift: {pitch_shift} semitones...")
+        logger.info("Applying pitch shift: %s semitones...", pitch_shift)
         f0_shifted = self._shift_pitch(f0, pitch_shift)
         
         # Modify formants (spectral envelope)
-        logger.info(f"Applying formant shift: {formant_shift}x...")
+        logger.info("Applying formant shift: %sx...", formant_shift)
         sp_shifted = self._shift_formants(sp, formant_shift, sr)
         
         # Synthesize modified audio
@@ -461,7 +461,7 @@ class VoiceChanger:
         
         # Save
         sf.write(output_file, audio_modified, sr)
-        logger.info(f"RVC conversion completed: {output_file}")
+        logger.info("RVC conversion completed: %s", output_file)
         
         return duration
     
@@ -522,7 +522,7 @@ class VoiceChanger:
         **kwargs
     ) -> Dict[str, any]:
         """Batch process multiple files"""
-        logger.info(f"Starting RVC batch processing of {len(input_files)} files")
+        logger.info("Starting RVC batch processing of %s files", len(input_files))
         
         Path(output_dir).mkdir(parents=True, exist_ok=True)
         
@@ -554,7 +554,7 @@ class VoiceChanger:
                 })
                 
             except Exception as e:
-                logger.error(f"Failed to process {input_file}: {str(e)}")
+                logger.error("Failed to process %s: %s", input_file, e)
                 results['failed'] += 1
                 results['files'].append({
                     'input': input_file,
@@ -563,7 +563,7 @@ class VoiceChanger:
                     'error': str(e)
                 })
         
-        logger.info(f"RVC batch processing completed: {results['successful']} successful, {results['failed']} failed")
+        logger.info("RVC batch processing completed: %s successful, %s failed", results['successful'], results['failed'])
         return results
     
     def _process_with_silero(
@@ -575,7 +575,7 @@ class VoiceChanger:
         use_parallel: bool = None
     ) -> Dict[str, any]:
         """Process with Silero TTS (for Russian)"""
-        logger.info(f"Processing with Silero TTS (Russian), preserve_prosody={preserve_prosody}")
+        logger.info("Processing with Silero TTS (Russian), preserve_prosody=%s", preserve_prosody)
         
         # Determine if we should use parallel processing
         if use_parallel is None:
@@ -589,12 +589,12 @@ class VoiceChanger:
                 
                 # Only use parallel if duration > 3 minutes
                 if duration_seconds > 180:
-                    logger.info(f"Audio duration: {duration_seconds/60:.1f} minutes - using parallel multiprocessing")
+                    logger.info("Audio duration: %.1f minutes - using parallel multiprocessing", duration_seconds/60)
                     return self._process_with_silero_parallel(input_file, output_file, voice, preserve_prosody)
                 else:
-                    logger.info(f"Audio duration: {duration_seconds/60:.1f} minutes - using sequential processing")
+                    logger.info("Audio duration: %.1f minutes - using sequential processing", duration_seconds/60)
             except Exception as e:
-                logger.warning(f"Could not determine duration: {e}, defaulting to parallel")
+                logger.warning("Could not determine duration: %s, defaulting to parallel", e)
         
         result = self.silero_changer.convert_voice(
             input_file,
@@ -699,7 +699,7 @@ class VoiceChanger:
                 duration_seconds = librosa.get_duration(path=input_file)
                 
                 if duration_seconds > 180:  # > 3 minutes
-                    logger.info(f"Audio duration: {duration_seconds/60:.1f} minutes - using parallel multiprocessing with background")
+                    logger.info("Audio duration: %.1f minutes - using parallel multiprocessing with background", duration_seconds/60)
                     
                     result_file = self.parallel_processor.process_with_background(
                         input_file=input_file,
@@ -723,7 +723,7 @@ class VoiceChanger:
                         'method': f'{method.capitalize()} (Parallel Multiprocessing + Background Preservation)'
                     }
             except Exception as e:
-                logger.warning(f"Could not determine duration: {e}, using sequential processing")
+                logger.warning("Could not determine duration: %s, using sequential processing", e)
         
         # Sequential processing with background preservation
         logger.info("Using sequential processing with background preservation...")
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import re
 import time
 from typing import Any
 
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+from google.auth.exceptions import RefreshError
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build_from_document
+from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload
 
 from shared.youtube.token_refresh import build_credentials, ensure_fresh_credentials
 
@@ -18,6 +21,36 @@ MAX_TITLE_LEN = 100
 MAX_DESCRIPTION_LEN = 5000
 DEFAULT_CATEGORY = "22"  # People & Blogs
 RESUMABLE_MAX_RETRIES = 3
+# Read buffer for the video file: the body is streamed in small blocks, so a
+# large buffer turns most of those reads into memory copies.
+UPLOAD_READ_BUFFER = 1 << 20
+
+# Auth failures that no retry can fix (revoked or expired grant).  Google
+# surfaces them as RefreshError or inside an HttpError's message.
+_TOKEN_ERROR_PATTERNS = ["invalid_grant", "Token has been expired or revoked", "token expired"]
+_TOKEN_ERROR_RE = re.compile("|".join(map(re.escape, _TOKEN_ERROR_PATTERNS)), re.IGNORECASE)
+
+
+def is_token_error(message: str) -> bool:
+    """True if *message* reports a revoked or expired OAuth grant."""
+    return _TOKEN_ERROR_RE.search(message) is not None
+
+
+# Parsed youtube v3 discovery doc, shared by every service we build.
+_discovery_doc: dict | None = None
+
+
+def load_discovery_doc() -> dict:
+    """Return the bundled youtube v3 discovery doc, parsed once per process.
+
+    ``build()`` re-reads and re-parses the static doc on every call; handing
+    ``build_from_document`` a dict skips both.  Call this before forking
+    workers so child processes inherit the parsed copy.
+    """
+    global _discovery_doc
+    if _discovery_doc is None:
+        _discovery_doc = json.loads(discovery_cache.get_static_doc("youtube", "v3"))
+    return _discovery_doc
 
 
 def create_service(
@@ -40,7 +73,7 @@ def create_service(
         token_expires_at=token_expires_at,
     )
     creds = ensure_fresh_credentials(creds, channel_id=channel_id)
-    return build("youtube", "v3", credentials=creds), creds
+    return build_from_document(load_discovery_doc(), credentials=creds), creds
 
 
 def upload_video(
@@ -67,9 +100,10 @@ def upload_video(
         },
     }
 
-    media = MediaFileUpload(file_path, chunksize=-1, resumable=True, mimetype="video/mp4")
-    request = service.videos().insert(part="snippet,status", body=body, media_body=media)
-    response = _resumable_upload(request)
+    with open(file_path, "rb", buffering=UPLOAD_READ_BUFFER) as fh:
+        media = MediaIoBaseUpload(fh, mimetype="video/mp4", chunksize=-1, resumable=True)
+        request = service.videos().insert(part="snippet,status", body=body, media_body=media)
+        response = _resumable_upload(request)
 
     video_id = response.get("id")
     logger.info("Video uploaded: id=%s title=%s", video_id, title[:60])
@@ -131,10 +165,11 @@ def _resumable_upload(request) -> dict[str, Any]:
                 return response
             if response is not None:
                 raise RuntimeError(f"Upload returned unexpected response: {response}")
+        except RefreshError:
+            raise  # auth errors (revoked/expired grant) — don't retry
         except Exception as exc:
-            err = str(exc)
-            if "invalid_grant" in err or "Token has been expired or revoked" in err:
-                raise  # auth errors — don't retry
+            if is_token_error(str(exc)):
+                raise  # same auth failure wrapped in an HttpError
             if retry < RESUMABLE_MAX_RETRIES:
                 retry += 1
                 wait = 2 ** retry
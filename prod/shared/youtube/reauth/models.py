@@ -13,7 +13,7 @@ class ReauthStatus(str, Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+@dataclass(slots=True)
 class ReauthResult:
     """Result snapshot of an automation run for a specific channel."""
 
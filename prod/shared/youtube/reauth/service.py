@@ -19,7 +19,7 @@ from shared.youtube.reauth.models import (
     ReauthResult,
     ReauthStatus,
 )
-from shared.db.repositories import channel_repo, console_repo, credential_repo, audit_repo
+from shared.db.repositories import channel_repo, credential_repo, audit_repo
 from shared.notifications import telegram
 
 import logging
@@ -52,7 +52,7 @@ class ServiceConfig:
     headless: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class _ChannelOAuthInfo:
     """Minimal info needed to run OAuth for a channel."""
 
@@ -73,19 +73,13 @@ class YouTubeReauthService:
 
     def _load_oauth_info(self, channel_id: int) -> Optional[_ChannelOAuthInfo]:
         """Load channel + OAuth client credentials from DB."""
-        channel = channel_repo.get_channel_by_id(channel_id)
+        channel = channel_repo.get_channel_oauth(channel_id)
         if not channel:
             logger.error("Channel not found: id=%d", channel_id)
             return None
 
-        client_id = None
-        client_secret = None
-        console_id = channel.get("console_id")
-        if console_id:
-            console = console_repo.get_console_by_id(console_id)
-            if console:
-                client_id = console.get("client_id")
-                client_secret = console.get("client_secret")
+        client_id = channel.get("client_id")
+        client_secret = channel.get("client_secret")
 
         if not client_id:
             client_id = os.getenv("YOUTUBE_MAIN_CLIENT_ID")
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import threading
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -19,6 +20,30 @@ SCOPES = ["https://www.googleapis.com/auth/youtube.upload",
 
 TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
 
+# Fixed pool of striped locks: channels sharing a stripe just serialize their
+# refreshes, and the pool doesn't grow with the number of channels seen.
+_REFRESH_LOCK_STRIPES = 64
+_refresh_locks = tuple(threading.Lock() for _ in range(_REFRESH_LOCK_STRIPES))
+# channel_id -> (refresh_token, access_token, naive UTC expiry) from the last
+# refresh in this process.  Only reused for the same refresh_token, so tokens
+# minted from a grant that has since been re-authorized are never handed out.
+_refreshed_tokens: dict[int, tuple[str, str, datetime]] = {}
+# One Request (and its requests.Session) per thread, so refreshes reuse the
+# keep-alive connection to oauth2.googleapis.com.  Sessions aren't shared
+# across threads because requests doesn't guarantee they're thread-safe.
+_transport_local = threading.local()
+
+
+def _channel_lock(channel_id: int) -> threading.Lock:
+    return _refresh_locks[channel_id % _REFRESH_LOCK_STRIPES]
+
+
+def _transport() -> Request:
+    request = getattr(_transport_local, "request", None)
+    if request is None:
+        request = _transport_local.request = Request()
+    return request
+
 
 def build_credentials(
     access_token: str,
@@ -74,16 +99,36 @@ def ensure_fresh_credentials(
     if not creds.refresh_token:
         raise RuntimeError("No refresh_token available; re-authentication required")
 
-    logger.info("Refreshing YouTube OAuth token (channel_id=%s)", channel_id)
-    creds.refresh(Request())
-
-    if channel_id is not None:
-        channel_repo.update_channel_tokens(
-            channel_id=channel_id,
-            access_token=creds.token,
-            refresh_token=creds.refresh_token,
-            token_expires_at=creds.expiry,
-        )
-        logger.info("Persisted refreshed token for channel_id=%s", channel_id)
+    if channel_id is None:
+        logger.info("Refreshing YouTube OAuth token (channel_id=%s)", channel_id)
+        creds.refresh(_transport())
+        return creds
+
+    # Single-flight per channel: concurrent callers in this process (scheduler
+    # token-check threads, API requests) wait for one refresh and reuse it.
+    with _channel_lock(channel_id):
+        cached = _refreshed_tokens.get(channel_id)
+        if (
+            cached
+            and cached[0] == creds.refresh_token
+            and cached[2] - datetime.utcnow() >= TOKEN_REFRESH_MARGIN
+        ):
+            creds.token, creds.expiry = cached[1], cached[2]
+            return creds
+
+        logger.info("Refreshing YouTube OAuth token (channel_id=%s)", channel_id)
+        creds.refresh(_transport())
+        if creds.expiry:
+            _refreshed_tokens[channel_id] = (creds.refresh_token, creds.token, creds.expiry)
+        else:
+            _refreshed_tokens.pop(channel_id, None)
+
+    channel_repo.update_channel_tokens(
+        channel_id=channel_id,
+        access_token=creds.token,
+        refresh_token=creds.refresh_token,
+        token_expires_at=creds.expiry,
+    )
+    logger.info("Persisted refreshed token for channel_id=%s", channel_id)
 
     return creds
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 from typing import Any
 
-from shared.db.repositories import channel_repo, console_repo, task_repo
+import orjson
+
+from shared.db.repositories import channel_repo, task_repo
 from shared.notifications import telegram
 from shared.queue.types import VideoUploadPayload
 from shared.youtube import client as yt
@@ -25,7 +26,7 @@ def _set_progress(task_id: int, stage: str, pct: int = 0, **extra: Any) -> None:
         from shared.queue.config import get_redis
         r = get_redis()
         data = {"stage": stage, "pct": pct, **extra}
-        r.set(f"task:{task_id}:progress", json.dumps(data), ex=3600)
+        r.set(f"task:{task_id}:progress", orjson.dumps(data), ex=3600)
     except Exception:
         pass  # non-critical
 
@@ -33,7 +34,7 @@ def _set_progress(task_id: int, stage: str, pct: int = 0, **extra: Any) -> None:
 def process_upload(payload: VideoUploadPayload) -> dict[str, Any]:
     """Full upload pipeline for a single task.
 
-    1. Load channel + console creds from DB
+    1. Load channel tokens + console creds from DB (one JOIN)
     2. Create YouTube service (auto-refresh tokens)
     3. Upload video
     4. Set thumbnail, auto-like, post comment
@@ -45,23 +46,25 @@ def process_upload(payload: VideoUploadPayload) -> dict[str, Any]:
     task_repo.mark_task_processing(task_id)
     _set_progress(task_id, "preparing", 0)
 
-    channel = channel_repo.get_channel_by_id(channel_id)
+    # One stat: fails fast on a missing file and gives the size for progress.
+    try:
+        total_bytes = os.stat(payload.source_file_path).st_size
+    except FileNotFoundError:
+        _fail(task_id, f"Source file not found: {payload.source_file_path}")
+        return {"ok": False, "error": "file_not_found"}
+    except OSError:
+        total_bytes = 0
+
+    # Tokens + console OAuth client in one query, only the columns we use.
+    channel = channel_repo.get_channel_oauth(channel_id)
     if not channel:
         _fail(task_id, f"Channel {channel_id} not found")
         return {"ok": False, "error": "channel_not_found"}
 
-    console = console_repo.get_console_by_id(channel["console_id"]) if channel.get("console_id") else None
-    if not console:
+    if not channel["client_id"]:
         _fail(task_id, f"OAuth console not found for channel {channel_id}")
         return {"ok": False, "error": "console_not_found"}
 
-    # File size for progress tracking
-    total_bytes = 0
-    try:
-        total_bytes = os.path.getsize(payload.source_file_path)
-    except OSError:
-        pass
-
     # Build tags list from comma-separated keywords
     tags: list[str] = []
     if payload.keywords:
@@ -75,8 +78,8 @@ def process_upload(payload: VideoUploadPayload) -> dict[str, Any]:
             service, creds = yt.create_service(
                 access_token=channel["access_token"],
                 refresh_token=channel["refresh_token"],
-                client_id=console["client_id"],
-                client_secret=console["client_secret"],
+                client_id=channel["client_id"],
+                client_secret=channel["client_secret"],
                 token_expires_at=channel.get("token_expires_at"),
                 channel_id=channel_id,
             )
@@ -126,32 +129,36 @@ def process_upload(payload: VideoUploadPayload) -> dict[str, Any]:
             _set_progress(task_id, "retrying", 0)
             # If token error, reload channel from DB for retry
             if attempt < MAX_UPLOAD_ATTEMPTS - 1:
-                channel = channel_repo.get_channel_by_id(channel_id) or channel
+                channel = channel_repo.get_channel_oauth(channel_id) or channel
 
-    _fail(task_id, last_error, channel_id=channel_id)
+    _fail(task_id, last_error, channel_id=channel_id, channel_name=channel["name"])
     return {"ok": False, "error": last_error}
 
 
-_TOKEN_ERROR_PATTERNS = ["invalid_grant", "Token has been expired or revoked", "token expired"]
+def _is_token_error(error: str) -> bool:
+    return yt.is_token_error(error)
 
 
-def _is_token_error(error: str) -> bool:
-    return any(p.lower() in error.lower() for p in _TOKEN_ERROR_PATTERNS)
+_REAUTH_MSG = (
+    "Token expired for channel '{name}' (id={channel_id}). "
+    "Re-authorization required. Run: "
+    "python3 run_youtube_reauth.py {name}"
+)
 
 
-def _fail(task_id: int, error: str, channel_id: int | None = None) -> None:
+def _fail(
+    task_id: int, error: str, channel_id: int | None = None, channel_name: str | None = None,
+) -> None:
     logger.error("Task %d failed: %s", task_id, error)
     _audit_logger.info("task.failed task_id=%d error=%s", task_id, error[:200])
     _set_progress(task_id, "failed", 0)
     task_repo.mark_task_failed(task_id, error)
 
     if _is_token_error(error) and channel_id:
-        channel = channel_repo.get_channel_by_id(channel_id)
-        ch_name = channel["name"] if channel else f"id={channel_id}"
-        telegram.send(
-            f"Token expired for channel '{ch_name}' (id={channel_id}). "
-            f"Re-authorization required. Run: "
-            f"python3 run_youtube_reauth.py {ch_name}"
-        )
+        # Callers that already hold the channel pass its name; skip the lookup.
+        if channel_name is None:
+            channel = channel_repo.get_channel_by_id(channel_id)
+            channel_name = channel["name"] if channel else f"id={channel_id}"
+        telegram.send(_REAUTH_MSG.format(name=channel_name, channel_id=channel_id))
     else:
         telegram.send(f"Upload task {task_id} failed: {error}")
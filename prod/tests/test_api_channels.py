@@ -111,10 +111,12 @@ class TestRetryAllFailed:
     @patch("shared.db.repositories.user_repo.get_user_by_id", return_value=TEST_USER)
     @patch(f"{_EP}.get_channel_by_id", return_value=_CHANNEL_OWNED)
     @patch(f"{_EP}._task_repo.retry_all_failed_by_channel", return_value=3)
-    def test_owner_retries(self, mock_retry, mock_get, mock_user, app_client, auth_headers):
+    @patch(f"{_EP}.wake_scheduler")
+    def test_owner_retries(self, mock_wake, mock_retry, mock_get, mock_user, app_client, auth_headers):
         resp = app_client.post("/api/v1/channels/1/retry-all-failed", headers=auth_headers)
         assert resp.status_code == 200
         assert resp.json() == {"channel_id": 1, "retried": 3}
+        mock_wake.assert_called_once()
 
 
 class TestStatsFallback:
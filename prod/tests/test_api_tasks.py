@@ -37,6 +37,7 @@ class TestCreateTask:
              patch("shared.db.repositories.channel_repo.get_channel_by_id", return_value=_MOCK_CHANNEL), \
              patch("shared.db.repositories.task_repo.create_task", return_value=1), \
              patch("shared.db.repositories.task_repo.get_task", return_value=_task()), \
+             patch("app.api.endpoints.tasks.wake_scheduler") as mock_wake, \
              patch("app.core.audit.log"):
             resp = app_client.post("/api/v1/tasks/", json={
                 "channel_id": 10, "source_file_path": "uploads/v.mp4",
@@ -44,6 +45,7 @@ class TestCreateTask:
             }, headers=auth_headers)
         assert resp.status_code == 201
         assert resp.json()["title"] == "Test Video"
+        mock_wake.assert_called_once()
 
     def test_creation_failure(self, app_client, auth_headers):
         with patch("shared.db.repositories.user_repo.get_user_by_id", return_value=TEST_USER), \
@@ -56,6 +58,56 @@ class TestCreateTask:
         assert resp.status_code == 500
 
 
+class TestCreateTasksBatch:
+    def test_success_wakes_scheduler(self, app_client, auth_headers):
+        with patch("shared.db.repositories.user_repo.get_user_by_id", return_value=TEST_USER), \
+             patch("shared.db.repositories.task_repo.create_tasks_batch", return_value=[1, 2]), \
+             patch("shared.db.repositories.task_repo.get_tasks_by_ids",
+                   return_value=[_task(), _task(2)]) as mock_get, \
+             patch("app.api.endpoints.tasks.wake_scheduler") as mock_wake, \
+             patch("app.core.audit.log"):
+            resp = app_client.post("/api/v1/tasks/batch", json={"tasks": [
+                {"channel_id": 10, "source_file_path": "uploads/a.mp4",
+                 "title": "A", "scheduled_at": "2026-03-01T12:00:00"},
+                {"channel_id": 10, "source_file_path": "uploads/b.mp4",
+                 "title": "B", "scheduled_at": "2026-03-01T12:00:00"},
+            ]}, headers=auth_headers)
+        assert resp.status_code == 201
+        assert resp.json()["total"] == 2
+        mock_get.assert_called_once_with([1, 2])
+        mock_wake.assert_called_once()
+
+
+class TestUpdateTask:
+    def test_back_to_pending_wakes_scheduler(self, app_client, auth_headers):
+        with patch("shared.db.repositories.user_repo.get_user_by_id", return_value=TEST_USER), \
+             patch("shared.db.repositories.task_repo.get_task", return_value=_task(status=2)), \
+             patch("shared.db.repositories.task_repo.update_task_status", return_value=True), \
+             patch("app.api.endpoints.tasks.wake_scheduler") as mock_wake:
+            resp = app_client.put("/api/v1/tasks/1", json={"status": 0}, headers=auth_headers)
+        assert resp.status_code == 200
+        mock_wake.assert_called_once()
+
+    def test_other_status_does_not_wake(self, app_client, auth_headers):
+        with patch("shared.db.repositories.user_repo.get_user_by_id", return_value=TEST_USER), \
+             patch("shared.db.repositories.task_repo.get_task", return_value=_task()), \
+             patch("shared.db.repositories.task_repo.update_task_status", return_value=True), \
+             patch("app.api.endpoints.tasks.wake_scheduler") as mock_wake:
+            resp = app_client.put("/api/v1/tasks/1", json={"status": 4}, headers=auth_headers)
+        assert resp.status_code == 200
+        mock_wake.assert_not_called()
+
+    def test_reschedule_wakes_scheduler(self, app_client, auth_headers):
+        with patch("shared.db.repositories.user_repo.get_user_by_id", return_value=TEST_USER), \
+             patch("shared.db.repositories.task_repo.get_task", return_value=_task()), \
+             patch("shared.db.repositories.task_repo.update_task_scheduled_at", return_value=True), \
+             patch("app.api.endpoints.tasks.wake_scheduler") as mock_wake:
+            resp = app_client.put("/api/v1/tasks/1", json={"scheduled_at": "2026-03-02T12:00:00"},
+                                  headers=auth_headers)
+        assert resp.status_code == 200
+        mock_wake.assert_called_once()
+
+
 class TestGetTask:
     def test_not_found(self, app_client, auth_headers):
         with patch("shared.db.repositories.user_repo.get_user_by_id", return_value=TEST_USER), \
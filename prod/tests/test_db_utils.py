@@ -53,6 +53,11 @@ class TestDeserializeJson:
         assert deserialize_json("not json") is None
         assert deserialize_json("{broken", default="fallback") == "fallback"
 
+    def test_nan_and_wide_ints_decode_exactly(self):
+        x = deserialize_json('{"x": NaN}')["x"]
+        assert x != x
+        assert deserialize_json('{"n": 123456789012345678901234567890}') == {"n": 123456789012345678901234567890}
+
     def test_json_list_string(self):
         assert deserialize_json('["a", "b"]') == ["a", "b"]
 
@@ -89,6 +89,7 @@ class TestTaskNewPathValidation:
         with patch("shared.db.repositories.channel_repo.get_channel_by_id", return_value=channel), \
              patch("shared.db.repositories.user_repo.get_user_by_id", return_value=TEST_USER), \
              patch("shared.db.repositories.task_repo.create_task", return_value=42), \
+             patch("shared.queue.wake.wake_scheduler"), \
              patch.dict(os.environ, {"UPLOAD_DIR": str(upload_root)}):
             return app_client.post(
                 "/app/tasks/new",
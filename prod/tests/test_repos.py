@@ -133,6 +133,15 @@ class TestChannelRepo:
         assert result["uuid"] == "u-1"
         assert result["has_tokens"] is True
 
+    def test_get_channel_binds_id_to_prebuilt_stmt(self):
+        conn = _make_conn(fetchone=None)
+        with _patch_repo(CH_MOD, conn):
+            from shared.db.repositories import channel_repo
+            channel_repo.get_channel_by_id(7)
+        stmt, params = conn.execute.call_args[0]
+        assert stmt is channel_repo._CHANNEL_BY_ID_STMT
+        assert params == {"channel_id": 7}
+
     def test_list_channels_empty(self):
         conn = _make_conn(fetchall=[])
         with _patch_repo(CH_MOD, conn):
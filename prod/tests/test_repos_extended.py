@@ -5,6 +5,7 @@ from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
+from sqlalchemy.dialects import mysql
 
 
 def _make_conn(fetchone=None, fetchall=None, rowcount=0, lastrowid=1, scalar=0):
@@ -62,6 +63,26 @@ class TestConsoleRepo:
             assert result["redirect_uris"] == ["http://localhost"]
             assert result["enabled"] is True
 
+    def test_get_consoles_by_ids(self):
+        rows = [
+            (1, 1, "A", None, "cid1", "sec1", None, None, None, 1, None, None),
+            (3, 1, "B", None, "cid3", "sec3", None, None, None, 1, None, None),
+        ]
+        conn, _ = _make_conn(fetchall=rows)
+        with _patch_repo(CONSOLE_MOD, conn):
+            from shared.db.repositories import console_repo
+            result = console_repo.get_consoles_by_ids([1, 3, 1, 7])
+            assert set(result) == {1, 3}
+            assert result[3]["client_id"] == "cid3"
+            conn.execute.assert_called_once()
+
+    def test_get_consoles_by_ids_empty(self):
+        conn, _ = _make_conn()
+        with _patch_repo(CONSOLE_MOD, conn):
+            from shared.db.repositories import console_repo
+            assert console_repo.get_consoles_by_ids([]) == {}
+            conn.execute.assert_not_called()
+
     def test_get_console_by_name(self):
         row = (2, 1, "Test", None, "cid", "sec", None, None, None, 1,
                datetime.now(), datetime.now())
@@ -135,6 +156,21 @@ class TestAuditRepo:
             assert result[0]["channel_id"] == 5
             assert result[0]["status"] == "started"
 
+    def test_get_latest_reauth_statuses(self):
+        conn, _ = _make_conn(fetchall=[(5, "failed"), (7, "success")])
+        with _patch_repo(AUDIT_MOD, conn):
+            from shared.db.repositories import audit_repo
+            result = audit_repo.get_latest_reauth_statuses([5, 7, 9])
+            assert result == {5: "failed", 7: "success"}
+            conn.execute.assert_called_once()
+
+    def test_get_latest_reauth_statuses_empty(self):
+        conn, _ = _make_conn()
+        with _patch_repo(AUDIT_MOD, conn):
+            from shared.db.repositories import audit_repo
+            assert audit_repo.get_latest_reauth_statuses([]) == {}
+            conn.execute.assert_not_called()
+
 
 # ── Stats repo ────────────────────────────────────────────────────
 
@@ -243,6 +279,38 @@ class TestChannelRepoExtended:
             from shared.db.repositories import channel_repo
             assert channel_repo.get_all_channels() == []
 
+    def test_get_channel_oauth(self):
+        row = (1, "Ch", 4, 1, "acc", "ref", None, "cid", "secret")
+        conn, _ = _make_conn(fetchone=row)
+        with _patch_repo(CHAN_MOD, conn):
+            from shared.db.repositories import channel_repo
+            ch = channel_repo.get_channel_oauth(1)
+            assert ch["console_id"] == 4
+            assert ch["refresh_token"] == "ref"
+            assert ch["client_id"] == "cid"
+            assert ch["client_secret"] == "secret"
+
+    def test_get_channel_oauth_not_found(self):
+        conn, _ = _make_conn(fetchone=None)
+        with _patch_repo(CHAN_MOD, conn):
+            from shared.db.repositories import channel_repo
+            assert channel_repo.get_channel_oauth(999) is None
+
+    def test_get_channels_with_tokens_stale_filter(self):
+        conn, _ = _make_conn(fetchall=[])
+        with _patch_repo(CHAN_MOD, conn):
+            from shared.db.repositories import channel_repo
+            channel_repo.get_channels_with_tokens()
+            assert "token_checked_at" not in str(conn.execute.call_args[0][0])
+            channel_repo.get_channels_with_tokens(stale_after_hours=20)
+            assert "token_checked_at" in str(conn.execute.call_args[0][0])
+
+    def test_get_enabled_channel_ids(self):
+        conn, _ = _make_conn(fetchall=[(3,), (1,)])
+        with _patch_repo(CHAN_MOD, conn):
+            from shared.db.repositories import channel_repo
+            assert channel_repo.get_enabled_channel_ids() == [3, 1]
+
 
 # ── Task repo extended ────────────────────────────────────────────
 
@@ -262,6 +330,28 @@ class TestTaskRepoExtended:
             from shared.db.repositories import task_repo
             assert task_repo.retry_task(1) is True
 
+    def test_update_status_to_pending_clears_backoff(self):
+        conn, _ = _make_conn(rowcount=1)
+        with _patch_repo(TASK_MOD, conn):
+            from shared.db.repositories import task_repo
+            assert task_repo.update_task_status(1, 0) is True
+        sql = str(conn.execute.call_args.args[0])
+        assert "next_attempt_at = NULL" in sql and "enqueue_attempts = 0" in sql
+
+    def test_update_status_other_keeps_backoff(self):
+        conn, _ = _make_conn(rowcount=1)
+        with _patch_repo(TASK_MOD, conn):
+            from shared.db.repositories import task_repo
+            task_repo.update_task_status(1, 4)
+        assert "next_attempt_at" not in str(conn.execute.call_args.args[0])
+
+    def test_retry_task_resets_enqueue_attempts(self):
+        conn, _ = _make_conn(rowcount=1)
+        with _patch_repo(TASK_MOD, conn):
+            from shared.db.repositories import task_repo
+            task_repo.retry_task(1)
+        assert "enqueue_attempts = 0" in str(conn.execute.call_args.args[0])
+
     def test_retry_task_wrong_status(self):
         conn, _ = _make_conn(rowcount=0)
         with _patch_repo(TASK_MOD, conn):
@@ -282,6 +372,93 @@ class TestTaskRepoExtended:
             ok = task_repo.update_task_upload_id(1, "yt-upload-123")
             assert ok is True
 
+    def test_get_tasks_by_ids_keeps_request_order(self):
+        def _row(tid):
+            return (tid, 5, "video", 0, datetime.now(), "/v.mp4", None, f"T{tid}",
+                    None, None, None, None, datetime.now(), None, None, None, 0, None, f"u{tid}")
+        conn, _ = _make_conn(fetchall=[_row(1), _row(3)])
+        with _patch_repo(TASK_MOD, conn):
+            from shared.db.repositories import task_repo
+            tasks = task_repo.get_tasks_by_ids([3, 2, 1])
+        assert [t["id"] for t in tasks] == [3, 1]
+        conn.execute.assert_called_once()
+
+    def test_claim_pending_tasks_locks_and_updates(self):
+        row = (7, 5, "video", 0, datetime.now(), "/v.mp4", None, "T", None, None, None,
+               None, datetime.now(), None, None, None, 4, None, "u7", 1)
+        conn, _ = _make_conn(fetchall=[row])
+        with _patch_repo(TASK_MOD, conn):
+            from shared.db.repositories import task_repo
+            from shared.db.models import TaskStatus
+            tasks = task_repo.claim_pending_tasks(limit=10)
+        assert [t["id"] for t in tasks] == [7]
+        assert tasks[0]["status"] == TaskStatus.PROCESSING.value
+        assert tasks[0]["retry_count"] == 4
+        assert tasks[0]["enqueue_attempts"] == 1
+        select_stmt = conn.execute.call_args_list[0].args[0]
+        assert "FOR UPDATE SKIP LOCKED" in str(select_stmt.compile(dialect=mysql.dialect()))
+        assert conn.execute.call_count == 2  # SELECT ... FOR UPDATE, then UPDATE
+
+    def test_claim_pending_tasks_respects_backoff(self):
+        conn, _ = _make_conn(fetchall=[])
+        with _patch_repo(TASK_MOD, conn):
+            from shared.db.repositories import task_repo
+            task_repo.claim_pending_tasks(limit=10)
+        assert "next_attempt_at" in str(conn.execute.call_args.args[0])
+
+    def test_requeue_task_sets_backoff(self):
+        conn, _ = _make_conn(rowcount=1)
+        with _patch_repo(TASK_MOD, conn):
+            from shared.db.repositories import task_repo
+            assert task_repo.requeue_task(5, 2) is True
+        sql, params = conn.execute.call_args.args
+        assert "next_attempt_at" in str(sql)
+        assert "retry_count" not in str(sql)
+        assert params == {"tid": 5, "delay": task_repo.REQUEUE_BACKOFF_BASE_SEC * 4}
+
+    def test_requeue_backoff_ignores_manual_retries(self):
+        # Claimed task retried by hand 6 times, first failed hand-off:
+        # the delay starts from BASE, not from 2**retry_count.
+        row = (7, 5, "video", 0, datetime.now(), "/v.mp4", None, "T", None, None, None,
+               None, datetime.now(), None, None, None, 6, None, "u7", 0)
+        conn, _ = _make_conn(fetchall=[row], rowcount=1)
+        with _patch_repo(TASK_MOD, conn):
+            from shared.db.repositories import task_repo
+            task = task_repo.claim_pending_tasks(limit=1)[0]
+            task_repo.requeue_task(task["id"], task["enqueue_attempts"])
+        assert conn.execute.call_args.args[1]["delay"] == task_repo.REQUEUE_BACKOFF_BASE_SEC
+
+    def test_requeue_backoff_is_capped(self):
+        conn, _ = _make_conn(rowcount=1)
+        with _patch_repo(TASK_MOD, conn):
+            from shared.db.repositories import task_repo
+            task_repo.requeue_task(5, 20)
+        assert conn.execute.call_args.args[1]["delay"] == task_repo.REQUEUE_BACKOFF_MAX_SEC
+
+    def test_release_claimed_tasks_only_touches_processing(self):
+        conn, _ = _make_conn(rowcount=2)
+        with _patch_repo(TASK_MOD, conn):
+            from shared.db.repositories import task_repo
+            assert task_repo.release_claimed_tasks([3, 4]) == 2
+            assert task_repo.release_claimed_tasks([]) == 0
+        sql = str(conn.execute.call_args.args[0].compile(dialect=mysql.dialect()))
+        assert "status" in sql and "IN" in sql
+        conn.execute.assert_called_once()
+
+    def test_claim_pending_tasks_none_due(self):
+        conn, _ = _make_conn(fetchall=[])
+        with _patch_repo(TASK_MOD, conn):
+            from shared.db.repositories import task_repo
+            assert task_repo.claim_pending_tasks(limit=10) == []
+        conn.execute.assert_called_once()
+
+    def test_get_tasks_by_ids_empty(self):
+        conn, _ = _make_conn()
+        with _patch_repo(TASK_MOD, conn):
+            from shared.db.repositories import task_repo
+            assert task_repo.get_tasks_by_ids([]) == []
+        conn.execute.assert_not_called()
+
 
 # ── User repo extended ────────────────────────────────────────────
 
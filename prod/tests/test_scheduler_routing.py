@@ -3,14 +3,12 @@
 import pytest
 from unittest.mock import patch, MagicMock
 from scheduler.jobs import enqueue_pending_tasks
-from shared.db.models import TaskStatus
 
-@patch("shared.db.repositories.task_repo.get_pending_tasks")
-@patch("shared.db.repositories.task_repo.mark_task_processing")
+@patch("shared.db.repositories.task_repo.claim_pending_tasks")
 @patch("shared.db.repositories.task_repo.update_task_status")
 @patch("scheduler.jobs.enqueue_voice_change")
 @patch("scheduler.jobs.enqueue_video_upload")
-def test_enqueue_routing_logic(mock_upload, mock_voice, mock_update, mock_mark, mock_get_pending):
+def test_enqueue_routing_logic(mock_upload, mock_voice, mock_update, mock_claim):
     # Case 1: DLE task (empty path + dle_source in legacy)
     dle_task = {
         "id": 1,
@@ -31,7 +29,7 @@ def test_enqueue_routing_logic(mock_upload, mock_voice, mock_update, mock_mark,
         "legacy_add_info": {}
     }
     
-    mock_get_pending.return_value = [dle_task, regular_task]
+    mock_claim.return_value = [dle_task, regular_task]
     
     count = enqueue_pending_tasks()
     
@@ -49,18 +47,132 @@ def test_enqueue_routing_logic(mock_upload, mock_voice, mock_update, mock_mark,
     assert reg_payload.task_id == 2
     assert reg_payload.source_file_path == "path/to/video.mp4"
     
-    # Verify both marked as processing
-    assert mock_mark.call_count == 2
+    # Verify both were claimed in one call (claim moves them to PROCESSING)
+    mock_claim.assert_called_once()
 
-@patch("shared.db.repositories.task_repo.get_pending_tasks")
-@patch("shared.db.repositories.task_repo.update_task_status")
-@patch("shared.queue.publisher.enqueue_video_upload")
-def test_enqueue_error_handling(mock_upload, mock_update_status, mock_get_pending):
+@patch("shared.db.repositories.task_repo.claim_pending_tasks")
+@patch("shared.db.repositories.task_repo.mark_task_failed")
+@patch("shared.db.repositories.task_repo.requeue_task")
+@patch("scheduler.jobs.enqueue_video_upload")
+def test_enqueue_error_handling(mock_upload, mock_requeue, mock_failed, mock_claim):
     # Mock failure during enqueuing
-    mock_get_pending.return_value = [{"id": 10, "channel_id": 5, "source_file_path": "x.mp4"}]
+    mock_claim.return_value = [{"id": 10, "channel_id": 5, "source_file_path": "x.mp4",
+                                "enqueue_attempts": 0}]
     mock_upload.side_effect = Exception("Redis down")
     
     enqueue_pending_tasks()
     
-    # Should reset status back to PENDING (0)
-    mock_update_status.assert_called_with(10, TaskStatus.PENDING.value)
+    # Should go back to PENDING (0) with enqueue_attempts bumped
+    mock_requeue.assert_called_once_with(10, 0)
+    mock_failed.assert_not_called()
+
+
+@patch("shared.db.repositories.task_repo.claim_pending_tasks")
+@patch("shared.db.repositories.task_repo.release_claimed_tasks", return_value=1)
+@patch("shared.db.repositories.task_repo.requeue_task", side_effect=Exception("DB down"))
+@patch("scheduler.jobs.enqueue_video_upload")
+def test_failed_requeue_releases_task(mock_upload, mock_requeue, mock_release, mock_claim):
+    mock_claim.return_value = [{"id": 10, "channel_id": 5, "source_file_path": "%s.mp4", "title": "T"},
+                               {"id": 11, "channel_id": 5, "source_file_path": "%s.mp4", "title": "T"}]
+    mock_upload.side_effect = [Exception("Redis down"), None]
+
+    assert enqueue_pending_tasks() == 1
+
+    # Task 11 was enqueued; only the one whose requeue failed is released
+    mock_release.assert_called_once_with([10])
+
+
+@patch("shared.db.repositories.task_repo.claim_pending_tasks")
+@patch("shared.db.repositories.task_repo.release_claimed_tasks", return_value=2)
+@patch("scheduler.jobs.enqueue_video_upload")
+def test_crash_mid_batch_releases_rest(mock_upload, mock_release, mock_claim):
+    mock_claim.return_value = [{"id": 10, "channel_id": 5, "source_file_path": "%s.mp4", "title": "T"},
+                               {"id": 11, "channel_id": 5, "source_file_path": "%s.mp4", "title": "T"},
+                               {"id": 12, "channel_id": 5, "source_file_path": "%s.mp4", "title": "T"}]
+    mock_upload.side_effect = [None, KeyboardInterrupt(), None]
+
+    with pytest.raises(KeyboardInterrupt):
+        enqueue_pending_tasks()
+
+    mock_release.assert_called_once_with([11, 12])
+
+
+@patch("shared.db.repositories.task_repo.claim_pending_tasks")
+@patch("shared.db.repositories.task_repo.mark_task_failed")
+@patch("shared.db.repositories.task_repo.requeue_task")
+@patch("scheduler.jobs.enqueue_video_upload")
+def test_enqueue_failures_never_fail_the_task(mock_upload, mock_requeue, mock_failed, mock_claim):
+    # Long Redis outage: well past the task's upload max_retries, still requeued
+    mock_claim.return_value = [{"id": 10, "channel_id": 5, "source_file_path": "x.mp4",
+                                "retry_count": 7, "enqueue_attempts": 12}]
+    mock_upload.side_effect = Exception("Redis down")
+
+    enqueue_pending_tasks()
+
+    mock_requeue.assert_called_once_with(10, 12)
+    mock_failed.assert_not_called()
+
+
+@patch("shared.metrics.push_youtube_token_expiries", return_value=0)
+@patch("scheduler.jobs.ensure_fresh_credentials")
+@patch("scheduler.jobs.build_credentials")
+@patch("shared.db.repositories.channel_repo.update_token_check")
+@patch("shared.db.repositories.console_repo.get_consoles_by_ids")
+@patch("shared.db.repositories.channel_repo.get_channels_with_tokens")
+def test_validate_channel_tokens_counts(mock_channels, mock_console, mock_check,
+                                        mock_build, mock_ensure, mock_push):
+    from scheduler.jobs import validate_channel_tokens
+
+    mock_channels.return_value = [
+        {"id": i, "name": f"ch{i}", "console_id": 1 if i != 3 else 99,
+         "access_token": "a", "refresh_token": "r", "token_expires_at": None}
+        for i in range(1, 6)
+    ]
+    mock_console.return_value = {1: {"client_id": "c", "client_secret": "s"}}
+
+    def _ensure(creds, channel_id):
+        if channel_id == 5:
+            raise Exception("invalid_grant")
+        return creds
+    mock_ensure.side_effect = _ensure
+
+    assert validate_channel_tokens() == (3, 2)
+    mock_console.assert_called_once()
+    results = {c.args[0]: c.kwargs["ok"] for c in mock_check.call_args_list}
+    assert results == {1: True, 2: True, 3: False, 4: True, 5: False}
+
+
+@patch("scheduler.run.wait_for_wake", side_effect=[False, False, True])
+def test_idle_returns_on_wake(mock_wait):
+    from scheduler import run
+
+    run._idle(60)
+    assert mock_wait.call_count == 3
+
+
+@patch("shared.queue.wake.get_redis")
+def test_wake_scheduler_coalesces_and_never_raises(mock_redis):
+    from shared.queue.config import SCHEDULER_WAKE_KEY
+    from shared.queue.wake import wake_scheduler
+
+    pipe = mock_redis.return_value.pipeline.return_value
+    wake_scheduler()
+    pipe.lpush.assert_called_once_with(SCHEDULER_WAKE_KEY, 1)
+    pipe.ltrim.assert_called_once_with(SCHEDULER_WAKE_KEY, 0, 0)
+
+    pipe.execute.side_effect = ConnectionError("down")
+    wake_scheduler()  # best-effort: must not propagate
+
+
+def test_youtube_data_api_client_cached_per_key():
+    from scheduler.jobs import _youtube_data_api
+
+    _youtube_data_api.cache_clear()
+    with patch("googleapiclient.discovery.build", side_effect=lambda *a, **kw: object()) as mock_build:
+        first = _youtube_data_api("key-a")
+        assert _youtube_data_api("key-a") is first
+        rotated = _youtube_data_api("key-b")
+    _youtube_data_api.cache_clear()
+
+    assert rotated is not first
+    assert [c.kwargs["developerKey"] for c in mock_build.call_args_list] == ["key-a", "key-b"]
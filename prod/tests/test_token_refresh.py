@@ -0,0 +1,113 @@
+"""Tests for shared.youtube.token_refresh — refresh single-flight per channel."""
+
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from shared.youtube import token_refresh
+
+
+@pytest.fixture(autouse=True)
+def _clear_refresh_state():
+    token_refresh._refreshed_tokens.clear()
+    yield
+    token_refresh._refreshed_tokens.clear()
+
+
+def _expired_creds():
+    creds = MagicMock()
+    creds.expired = True
+    creds.refresh_token = "refresh"
+    return creds
+
+
+class TestEnsureFreshCredentials:
+    def test_concurrent_callers_share_one_refresh(self):
+        refresh_started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def _refresh(creds):
+            def _do(_request):
+                calls.append(creds)
+                refresh_started.set()
+                release.wait(timeout=5)
+                creds.token = "new-token"
+                creds.expiry = datetime.utcnow() + timedelta(hours=1)
+            return _do
+
+        first, second = _expired_creds(), _expired_creds()
+        first.refresh.side_effect = _refresh(first)
+        second.refresh.side_effect = _refresh(second)
+
+        with patch("shared.db.repositories.channel_repo.update_channel_tokens") as mock_persist:
+            t = threading.Thread(target=token_refresh.ensure_fresh_credentials, args=(first, 7))
+            t.start()
+            assert refresh_started.wait(timeout=5)
+            waiter = threading.Thread(target=token_refresh.ensure_fresh_credentials, args=(second, 7))
+            waiter.start()
+            release.set()
+            t.join(timeout=5)
+            waiter.join(timeout=5)
+
+        assert calls == [first]
+        second.refresh.assert_not_called()
+        assert second.token == "new-token"
+        mock_persist.assert_called_once()
+
+    def test_other_channels_refresh_independently(self):
+        a, b = _expired_creds(), _expired_creds()
+        for c in (a, b):
+            c.refresh.side_effect = lambda _r, c=c: setattr(c, "expiry", datetime.utcnow() + timedelta(hours=1))
+        with patch("shared.db.repositories.channel_repo.update_channel_tokens"):
+            token_refresh.ensure_fresh_credentials(a, channel_id=1)
+            token_refresh.ensure_fresh_credentials(b, channel_id=2)
+        a.refresh.assert_called_once()
+        b.refresh.assert_called_once()
+
+    def test_reauthorized_channel_does_not_reuse_cached_token(self):
+        old = _expired_creds()
+        old.refresh.side_effect = lambda _r: (
+            setattr(old, "token", "from-old-grant"),
+            setattr(old, "expiry", datetime.utcnow() + timedelta(hours=1)),
+        )
+        new = _expired_creds()
+        new.refresh_token = "reauthorized"
+        new.refresh.side_effect = lambda _r: (
+            setattr(new, "token", "from-new-grant"),
+            setattr(new, "expiry", datetime.utcnow() + timedelta(hours=1)),
+        )
+        with patch("shared.db.repositories.channel_repo.update_channel_tokens"):
+            token_refresh.ensure_fresh_credentials(old, channel_id=7)
+            token_refresh.ensure_fresh_credentials(new, channel_id=7)
+        new.refresh.assert_called_once()
+        assert new.token == "from-new-grant"
+
+    def test_lock_pool_is_fixed(self):
+        assert token_refresh._channel_lock(7) is token_refresh._channel_lock(7)
+        for cid in range(1000):
+            token_refresh._channel_lock(cid)
+        assert len(token_refresh._refresh_locks) == token_refresh._REFRESH_LOCK_STRIPES
+
+    def test_no_channel_id_skips_persist(self):
+        creds = _expired_creds()
+        with patch("shared.db.repositories.channel_repo.update_channel_tokens") as mock_persist:
+            token_refresh.ensure_fresh_credentials(creds)
+        creds.refresh.assert_called_once()
+        mock_persist.assert_not_called()
+
+
+class TestTransport:
+    def test_request_reused_per_thread(self):
+        token_refresh._transport_local.__dict__.clear()
+        with patch.object(token_refresh, "Request", side_effect=lambda: object()):
+            mine = token_refresh._transport()
+            assert token_refresh._transport() is mine
+            other = []
+            t = threading.Thread(target=lambda: other.append(token_refresh._transport()))
+            t.start()
+            t.join(timeout=5)
+        assert other and other[0] is not mine
+        token_refresh._transport_local.__dict__.clear()
@@ -3,6 +3,8 @@
 from unittest.mock import MagicMock, patch
 from contextlib import contextmanager
 
+import pytest
+
 from shared.youtube.upload import _is_token_error, _fail, _set_progress
 
 
@@ -53,3 +55,85 @@ class TestFail:
         msg = mock_tg.call_args[0][0]
         assert "TestCh" in msg
         assert "Re-authorization" in msg
+
+    def test_token_error_uses_passed_channel_name(self):
+        with patch("shared.db.repositories.task_repo.mark_task_failed"), \
+             patch("shared.db.repositories.channel_repo.get_channel_by_id") as mock_get, \
+             patch("shared.notifications.telegram.send") as mock_tg:
+            _fail(1, "invalid_grant", channel_id=10, channel_name="KnownCh")
+        mock_get.assert_not_called()
+        assert "KnownCh" in mock_tg.call_args[0][0]
+
+
+class TestProcessUpload:
+    def test_missing_file_fails_without_uploading(self, tmp_path):
+        from shared.queue.types import VideoUploadPayload
+        from shared.youtube.upload import process_upload
+
+        payload = VideoUploadPayload(task_id=1, channel_id=10,
+                                     source_file_path=str(tmp_path / "gone.mp4"), title="T")
+        with patch("shared.db.repositories.task_repo.mark_task_processing"), \
+             patch("shared.youtube.upload._set_progress"), \
+             patch("shared.youtube.upload._fail") as mock_fail, \
+             patch("shared.db.repositories.channel_repo.get_channel_oauth") as mock_channel, \
+             patch("shared.youtube.client.create_service") as mock_service:
+            result = process_upload(payload)
+        assert result == {"ok": False, "error": "file_not_found"}
+        mock_fail.assert_called_once()
+        mock_channel.assert_not_called()
+        mock_service.assert_not_called()
+
+    def test_channel_without_console_fails(self, tmp_path):
+        from shared.queue.types import VideoUploadPayload
+        from shared.youtube.upload import process_upload
+
+        video = tmp_path / "v.mp4"
+        video.write_bytes(b"x")
+        payload = VideoUploadPayload(task_id=1, channel_id=10, source_file_path=str(video), title="T")
+        channel = {"id": 10, "name": "Ch", "console_id": None, "access_token": "a",
+                   "refresh_token": "r", "token_expires_at": None,
+                   "client_id": None, "client_secret": None}
+        with patch("shared.db.repositories.task_repo.mark_task_processing"), \
+             patch("shared.youtube.upload._set_progress"), \
+             patch("shared.youtube.upload._fail") as mock_fail, \
+             patch("shared.db.repositories.channel_repo.get_channel_oauth", return_value=channel), \
+             patch("shared.youtube.client.create_service") as mock_service:
+            result = process_upload(payload)
+        assert result == {"ok": False, "error": "console_not_found"}
+        mock_fail.assert_called_once()
+        mock_service.assert_not_called()
+
+
+class TestResumableUpload:
+    def test_refresh_error_not_retried(self):
+        from google.auth.exceptions import RefreshError
+        from shared.youtube.client import _resumable_upload
+
+        request = MagicMock()
+        request.next_chunk.side_effect = RefreshError("invalid_grant: Token has been expired or revoked.")
+        with patch("shared.youtube.client.time.sleep") as mock_sleep:
+            with pytest.raises(RefreshError):
+                _resumable_upload(request)
+        assert request.next_chunk.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_wrapped_token_error_not_retried(self):
+        from shared.youtube.client import _resumable_upload
+
+        request = MagicMock()
+        request.next_chunk.side_effect = Exception(
+            "<HttpError 401: Token has been expired or revoked.>"
+        )
+        with patch("shared.youtube.client.time.sleep") as mock_sleep:
+            with pytest.raises(Exception, match="expired or revoked"):
+                _resumable_upload(request)
+        assert request.next_chunk.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_transient_error_retried(self):
+        from shared.youtube.client import _resumable_upload
+
+        request = MagicMock()
+        request.next_chunk.side_effect = [ConnectionError("reset"), (None, {"id": "vid"})]
+        with patch("shared.youtube.client.time.sleep"):
+            assert _resumable_upload(request) == {"id": "vid"}
@@ -15,6 +15,7 @@ from shared.notifications import telegram
 from shared.metrics import instrument_job
 from shared.queue.config import get_redis
 from shared.queue.types import DleProcessingPayload
+from shared.queue.wake import wake_scheduler
 from workers._job_bootstrap import bootstrap_job
 
 logger = logging.getLogger(__name__)
@@ -73,6 +74,7 @@ def process_dle_task(payload: DleProcessingPayload) -> dict[str, Any]:
             })
 
         logger.info("[DLE PROCESSOR WORKER] Task %s updated with video path", task_id)
+        wake_scheduler()
         telegram.send(f"✅ DLE Video Ready\nTask {task_id}: {task.get('title')}")
 
         return {
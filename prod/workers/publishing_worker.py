@@ -24,4 +24,6 @@ def process_upload_job(payload: VideoUploadPayload) -> dict[str, Any]:
 if __name__ == "__main__":
     from shared.queue.config import QUEUE_PUBLISHING
     from shared.queue.worker_runner import main
+    from shared.youtube.client import load_discovery_doc
+    load_discovery_doc()  # parse once here; forked work-horses inherit it
     main([QUEUE_PUBLISHING], "cff-publishing")
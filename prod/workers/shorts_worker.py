@@ -16,6 +16,7 @@ from shared.shorts.thumbnail import extract_frames, pick_best_thumbnail
 from shared.db.repositories.task_repo import create_task
 from shared.metrics import instrument_job
 from shared.notifications import telegram
+from shared.queue.wake import wake_scheduler
 from workers._job_bootstrap import bootstrap_job
 
 logger = logging.getLogger(__name__)
@@ -94,7 +95,9 @@ def run_shorts_job(payload: ShortsPayload) -> dict[str, Any]:
                 )
                 if task_id:
                     created_tasks += 1
-                    
+
+        if created_tasks:
+            wake_scheduler()  # the first short is due immediately
         return {"ok": True, "created_tasks": created_tasks}
     except Exception as exc:
         error = str(exc)
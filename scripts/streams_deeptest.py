@@ -7,6 +7,7 @@ Mints admin Bearer JWT, exercises every /api/v1/streams/* endpoint and the
 """
 from __future__ import annotations
 
+import importlib.util
 import json
 import os
 import sys
@@ -15,7 +16,10 @@ from urllib.parse import urlparse
 
 import requests
 
-sys.path.insert(0, "/opt/content-fabric/prod")
+# Copied to /tmp on the server, so the prod tree isn't importable by default;
+# skip the path hack when run with PYTHONPATH set or from prod/ itself.
+if importlib.util.find_spec("shared") is None:
+    sys.path.insert(0, os.environ.get("CFF_PROD_DIR", "/opt/content-fabric/prod"))
 from app.core.security import create_access_token  # noqa: E402
 from shared.db.connection import get_connection  # noqa: E402
 from sqlalchemy import text  # noqa: E402